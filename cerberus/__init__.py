@@ -2,8 +2,10 @@
 
 from .downloader import (
     load_settings,
+    get_settings,
     download_with_youtube_dl,
     download_video,
+    download_video_ranged,
     extract_video_name,
     extract_main_video_url,
     download_video_from_page,
@@ -13,8 +15,10 @@ from .downloader import (
 
 __all__ = [
     "load_settings",
+    "get_settings",
     "download_with_youtube_dl",
     "download_video",
+    "download_video_ranged",
     "extract_video_name",
     "extract_main_video_url",
     "download_video_from_page",
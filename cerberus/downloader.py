@@ -1,78 +1,123 @@
 # Converter/CerberusFetch.py
 
 import os
+import sys
 import re
 import platform
 import subprocess
 import time
+import math
+import errno
 import json
-import signal
+import html
 import threading
 import argparse
-import requests
 import logging
 import shutil
-from tqdm import tqdm
-from urllib.parse import urlparse, unquote
-
-# Selenium Imports
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
-from selenium.common.exceptions import NoSuchElementException, NoSuchWindowException, WebDriverException
-
-import yt_dlp
-
-# Global event to signal download termination
-stop_download = threading.Event()
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from types import SimpleNamespace
+from urllib.parse import urlparse, urldefrag, unquote, parse_qs
+
+# orjson decodes the Selenium performance log much faster; json is the fallback
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Heavy dependencies (selenium, yt_dlp, requests, bs4, tqdm) are imported inside
+# the functions that use them, so config-only commands do not pay their import cost.
+
+# Event to signal download termination, created on first use (see _get_stop_event)
+_stop_download = None
+_stop_download_lock = threading.Lock()
+
+def _get_stop_event():
+    """Returns the global download-termination event, creating it on first use."""
+    global _stop_download
+    if _stop_download is None:
+        with _stop_download_lock:
+            if _stop_download is None:
+                _stop_download = threading.Event()
+    return _stop_download
+
+def _handle_sigint(sig, frame):
+    """First Ctrl+C: set the stop event. The default handler is restored so the next one raises KeyboardInterrupt."""
+    import signal
+
+    _get_stop_event().set()
+    print("\nStopping downloads... (press Ctrl+C again to quit immediately)")
+    signal.signal(signal.SIGINT, signal.default_int_handler)
 
 # ================================
 # Central Configuration Management
 # ================================
 
+# Platform facts resolved once at import time
+_IS_WINDOWS = platform.system() == "Windows"
+_IS_MAC = platform.system() == "Darwin"
+_APPDATA_DIR = os.environ.get("APPDATA")
+_HOME_DIR = Path(os.path.expanduser("~"))
+
+@functools.lru_cache(maxsize=None)
 def get_config_dir():
     """
-    Returns the path to the centralized configuration directory.
+    Returns the path (pathlib.Path) to the centralized configuration directory.
     On Windows, uses %APPDATA%\\.Cerberus.
     On other systems, uses ~/.Cerberus.
+    The directory is created on the first call; later calls return the cached path.
     """
-    if platform.system() == "Windows":
-        config_dir = os.path.join(os.environ.get("APPDATA"), ".Cerberus")
+    if _IS_WINDOWS:
+        config_dir = Path(_APPDATA_DIR) / ".Cerberus"
     else:
-        config_dir = os.path.join(os.path.expanduser("~"), ".Cerberus")
-    if not os.path.exists(config_dir):
-        os.makedirs(config_dir)
+        config_dir = _HOME_DIR / ".Cerberus"
+    os.makedirs(config_dir, exist_ok=True)
     return config_dir
 
 CONFIG_DIR = get_config_dir()
-SETTINGS_PATH = os.path.join(CONFIG_DIR, "Settings.txt")
-LOG_PATH = os.path.join(CONFIG_DIR, "Cerberus.log")
-DEFAULT_DOWNLOAD_DIR = os.path.join(CONFIG_DIR, "Downloads")
+SETTINGS_PATH = CONFIG_DIR / "Settings.txt"
+LOG_PATH = CONFIG_DIR / "Cerberus.log"
+DEFAULT_DOWNLOAD_DIR = CONFIG_DIR / "Downloads"
 
 # Ensure default download folder exists
-if not os.path.exists(DEFAULT_DOWNLOAD_DIR):
-    os.makedirs(DEFAULT_DOWNLOAD_DIR)
+os.makedirs(DEFAULT_DOWNLOAD_DIR, exist_ok=True)
 
 # ================================
 # Logging Setup
 # ================================
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
 logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(message)s",
+    level=logging.INFO,
+    format=LOG_FORMAT,
     handlers=[
         logging.FileHandler(LOG_PATH, encoding="utf-8"),
-        logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
-def log_info(message):
-    logger.info(message)
+def log_info(message, *args):
+    """Logs at INFO level; args are %-formatted only if the record is emitted."""
+    logger.info(message, *args)
 
-def log_error(message):
-    logger.error(message)
+def log_error(message, *args):
+    """Logs at ERROR level; args are %-formatted only if the record is emitted."""
+    logger.error(message, *args)
+
+def configure_logging(settings, hidden=False):
+    """
+    Applies logging settings once they are known:
+      - debug=true enables DEBUG records, including those of urllib3, selenium and yt_dlp
+      - console log output is only attached if output is not hidden
+    """
+    root = logging.getLogger()
+    if settings.get('debug', 'false').lower() == 'true':
+        root.setLevel(logging.DEBUG)
+    if not hidden and not any(type(h) is logging.StreamHandler for h in root.handlers):
+        console = logging.StreamHandler()
+        console.setFormatter(logging.Formatter(LOG_FORMAT))
+        root.addHandler(console)
 
 def print_if_not_ignored(message, settings):
     """
@@ -85,6 +130,105 @@ def print_if_not_ignored(message, settings):
 # Utility Functions
 # ================================
 
+_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = threading.Lock()
+
+def _socket_buffer_adapter(adapter_cls, rcvbuf):
+    """
+    Returns an adapter_cls subclass whose connections request a receive buffer of rcvbuf bytes.
+    Note that a fixed SO_RCVBUF turns off the kernel's receive buffer autotuning on Linux.
+    """
+    import socket
+    from urllib3.connection import HTTPConnection
+
+    class SocketBufferAdapter(adapter_cls):
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf)]
+            super().init_poolmanager(*args, **kwargs)
+
+    return SocketBufferAdapter
+
+def _get_http_session():
+    """Returns the shared HTTP session (keep-alive + connection pool), created on first use."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        with _HTTP_SESSION_LOCK:
+            if _HTTP_SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util import Retry
+                session = requests.Session()
+                # Retries are handled by the download loops (with back-off and ffmpeg fallback),
+                # so the adapter itself must never retry behind their back
+                adapter_kwargs = {'pool_connections': 32, 'pool_maxsize': 32, 'max_retries': Retry(total=0)}
+                try:
+                    rcvbuf = int(get_settings().get('socket_rcvbuf', 0))
+                except ValueError:
+                    rcvbuf = 0
+                if rcvbuf > 0:
+                    adapter = _socket_buffer_adapter(HTTPAdapter, rcvbuf)(**adapter_kwargs)
+                else:
+                    adapter = HTTPAdapter(**adapter_kwargs)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+def _warm_dns(urls):
+    """
+    Resolves the hosts of urls on a background daemon thread, so resolvers that cache
+    (nscd, systemd-resolved, the local DNS server) already have them when the downloads start.
+    """
+    hosts = set()
+    for url in urls:
+        try:
+            parsed = urlparse(url)
+            if parsed.hostname:
+                hosts.add((parsed.hostname, parsed.port or (80 if parsed.scheme == 'http' else 443)))
+        except ValueError:
+            continue
+    if not hosts:
+        return
+
+    def resolve():
+        import socket
+        for host, port in hosts:
+            try:
+                socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            except OSError:
+                pass
+
+    threading.Thread(target=resolve, name="cerberus-dns", daemon=True).start()
+
+# Per-host limits on simultaneous media connections (avoids HTTP 429 with parallel workers)
+_HOST_SLOTS = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+
+def _host_slot(url, settings):
+    """
+    Returns the semaphore limiting concurrent connections to url's host.
+    The limit comes from the 'max_connections_per_host' setting (default 5). A download holds
+    one slot; ranged downloads borrow one more per extra part (see _borrow_host_slots).
+    """
+    host = (urlparse(url).hostname or '').lower()
+    with _HOST_SLOTS_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            try:
+                limit = max(1, int(settings.get('max_connections_per_host', 5)))
+            except ValueError:
+                limit = 5
+            slot = _HOST_SLOTS[host] = threading.BoundedSemaphore(limit)
+    return slot
+
+def _borrow_host_slots(slot, wanted):
+    """Takes up to `wanted` free slots from a host's semaphore without waiting; returns how many were taken."""
+    taken = 0
+    while taken < wanted and slot.acquire(blocking=False):
+        taken += 1
+    return taken
+
 def get_default_download_dir(settings):
     """
     Determines the default download directory based on settings.
@@ -99,21 +243,22 @@ def get_default_download_dir(settings):
     custom_dir = settings.get('default_download_dir', 'DEFAULT')
 
     if not custom_dir or custom_dir.upper() == 'DEFAULT':
-        return DEFAULT_DOWNLOAD_DIR
+        return os.fspath(DEFAULT_DOWNLOAD_DIR)
 
     return os.path.expanduser(custom_dir)
 
 def open_file(file_path):
     """Opens the given file in the system's default editor."""
+    file_path = os.fspath(file_path)
     try:
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             os.startfile(file_path)
-        elif platform.system() == "Darwin":
+        elif _IS_MAC:
             subprocess.call(["open", file_path])
         else:
             subprocess.call(["xdg-open", file_path])
     except Exception as e:
-        log_error(f"Error opening file {file_path}: {e}")
+        log_error("Error opening file %s: %s", file_path, e)
 
 def build_settings(file_path=SETTINGS_PATH):
     """Creates the Settings.txt file if it does not exist."""
@@ -122,33 +267,136 @@ def build_settings(file_path=SETTINGS_PATH):
             f.write("browser_path=C:/PATH/TO/BROWSER/Browser.exe\n")
             f.write("# use --list-config to see the current/standart -config-settings\n")
             f.write("# use --example-config to view all available config-settings\n")
-        log_info(f"Settings file created at {file_path}")
+        invalidate_settings_cache(file_path)
+        log_info("Settings file created at %s", file_path)
+
+# Values used for any key missing from Settings.txt
+DEFAULT_SETTINGS = {
+    'minimized': 'false',
+    'overwrite_existing': 'false',
+    'output_always_hidden': 'false',
+    'ignoreerrors': 'false',
+    'yt_verbose': 'false',
+    'use_browser_cookies': 'false',
+    'sort_by': 'none',
+    'platform_use_og': 'false',
+    'sort_meta_parser': 'false',
+    'default_quality': 'best',
+    'use_cwd_as_default': 'false',
+    'default_download_dir': 'DEFAULT', # will use DEFAULT_DOWNLOAD_DIR
+    'max_concurrency': '4',
+    'max_parallel_downloads': '4',
+    'max_connections_per_host': '5',
+    'range_parts': '4',
+    'socket_rcvbuf': '0',
+    'threaded_writes': 'false',
+    'meta_cache_enabled': 'true',
+    'meta_cache_ttl': '86400',
+    'debug': 'false',
+}
+
+# Parsed settings keyed by file path -> ((mtime_ns, size), settings)
+_SETTINGS_CACHE = {}
+# Shared settings snapshot for get_settings() -> ((mtime_ns, size), settings)
+_CURRENT_SETTINGS = None
+_CURRENT_SETTINGS_LOCK = threading.Lock()
+
+def invalidate_settings_cache(file_path=None):
+    """Drops cached settings for file_path (or for all files if None)."""
+    global _CURRENT_SETTINGS
+    if file_path is None:
+        _SETTINGS_CACHE.clear()
+    else:
+        _SETTINGS_CACHE.pop(file_path, None)
+    _CURRENT_SETTINGS = None
 
-def load_settings(file_path=SETTINGS_PATH):
-    """Loads settings from the Settings.txt file."""
-    settings = {}
+def _settings_stamp(file_path):
+    """Returns a (mtime_ns, size) tuple identifying the file version, or None if missing."""
     try:
-        with open(file_path, 'r') as f:
-            for line in f:
-                if line.strip() and '=' in line and not line.strip().startswith('#'):
-                    key, value = line.split('=', 1)
-                    settings[key.strip()] = value.strip()
-    except FileNotFoundError:
-        log_error(f"Settings file {file_path} not found.")
-        build_settings(file_path)
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+# Pre-parsed JSON copy of SETTINGS_PATH; other settings files never get one
+SETTINGS_SIDECAR_PATH = CONFIG_DIR / "Settings.cache.json"
+
+def _uses_settings_sidecar(file_path):
+    """True if file_path is the user's Settings.txt (the only file with a JSON sidecar)."""
+    return os.path.abspath(file_path) == os.path.abspath(SETTINGS_PATH)
+
+def _read_settings_sidecar(stamp):
+    """Returns the pre-parsed settings if the sidecar matches Settings.txt's stamp, else None."""
+    try:
+        with open(SETTINGS_SIDECAR_PATH, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('stamp') == list(stamp) and isinstance(data.get('settings'), dict):
+            return data['settings']
+    except (OSError, ValueError, AttributeError):
+        pass
+    return None
+
+def _write_settings_sidecar(stamp, settings):
+    """Stores the parsed Settings.txt in SETTINGS_SIDECAR_PATH; failures are ignored."""
+    try:
+        with open(SETTINGS_SIDECAR_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'stamp': list(stamp), 'settings': settings}, f)
+    except OSError:
+        pass
+
+def load_settings(file_path=SETTINGS_PATH):
+    """
+    Loads settings from the Settings.txt file.
+    The parsed result is cached in memory and only re-read when the file changes.
+    For SETTINGS_PATH, a JSON copy (Settings.cache.json in the config folder) is used across runs
+    as long as Settings.txt is unchanged; other files are always parsed.
+    """
+    stamp = _settings_stamp(file_path)
+    cached = _SETTINGS_CACHE.get(file_path)
+    if stamp is not None and cached and cached[0] == stamp:
+        return dict(cached[1])
+
+    use_sidecar = stamp is not None and _uses_settings_sidecar(file_path)
+    settings = _read_settings_sidecar(stamp) if use_sidecar else None
+    if settings is None:
+        settings = {}
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                raw = f.read()
+            for line in raw.splitlines():
+                line = line.strip()
+                if not line or line[0] == '#' or '=' not in line:
+                    continue
+                key, value = line.split('=', 1)
+                settings[key.strip()] = value.strip()
+            if use_sidecar:
+                _write_settings_sidecar(stamp, settings)
+        except FileNotFoundError:
+            log_error("Settings file %s not found.", file_path)
+            build_settings(file_path)
     # Ensure defaults
-    if 'overwrite_existing' not in settings:
-        settings['overwrite_existing'] = 'false'
-    if 'sort_by' not in settings:
-        settings['sort_by'] = 'none'
-    if 'default_quality' not in settings:
-        settings['default_quality'] = 'best'
-    if 'use_cwd_as_default' not in settings:
-        settings['use_cwd_as_default'] = 'false'
-    if 'default_download_dir' not in settings:
-        settings['default_download_dir'] = 'DEFAULT' # will use DEFAULT_DOWNLOAD_DIR
+    settings = {**DEFAULT_SETTINGS, **settings}
+    if stamp is not None:
+        _SETTINGS_CACHE[file_path] = (stamp, dict(settings))
     return settings
 
+def get_settings():
+    """
+    Returns the settings from SETTINGS_PATH.
+    The same dict is handed out until Settings.txt changes, so callers must not modify it.
+    """
+    global _CURRENT_SETTINGS
+    stamp = _settings_stamp(SETTINGS_PATH)
+    current = _CURRENT_SETTINGS
+    if current is not None and stamp is not None and current[0] == stamp:
+        return current[1]
+    with _CURRENT_SETTINGS_LOCK:
+        current = _CURRENT_SETTINGS
+        if current is None or stamp is None or current[0] != stamp:
+            current = (stamp, load_settings(SETTINGS_PATH))
+            _CURRENT_SETTINGS = current
+        return current[1]
+
 def is_output_hidden(settings, args):
     """Checks whether console output should be hidden."""
     return settings.get('output_always_hidden', 'false').lower() == 'true' or args.hidden
@@ -167,6 +415,7 @@ def handle_config(args):
     Handles configuration commands:
       - --list-config: displays the current settings.
       - --example-config: creates an example configuration file.
+      - --clear-meta-cache: removes cached yt_dlp metadata.
       - --config (alone): opens the Settings.txt file in the default editor.
     """
     if not os.path.exists(SETTINGS_PATH):
@@ -174,15 +423,15 @@ def handle_config(args):
             f.write("browser_path=C:/PATH/TO/BROWSER/Browser.exe\n")
             f.write("# use --list-config to see the current/standart -config-settings\n")
             f.write("# use --example-config to view all available config-settings\n")
-        log_info(f"Created new settings file at {SETTINGS_PATH}")
+        invalidate_settings_cache(SETTINGS_PATH)
+        log_info("Created new settings file at %s", SETTINGS_PATH)
 
     if args.list_config:
-        settings = load_settings(SETTINGS_PATH)
-        custom_print("Current Settings:")
-        for key in sorted(settings.keys()):
-            custom_print(f"{key} = {settings[key]}")
+        settings = get_settings()
+        lines = ["Current Settings:"] + [f"{key} = {settings[key]}" for key in sorted(settings)]
+        custom_print("\n".join(lines))
     elif args.example_config:
-        example_path = os.path.join(CONFIG_DIR, "example_settings.txt")
+        example_path = CONFIG_DIR / "example_settings.txt"
         with open(example_path, 'w') as f:
             f.write(
                 """browser_path=C:/PATH/TO/BROWSER/Browser.exe
@@ -196,12 +445,26 @@ use_browser_cookies=false # needed for yt-downloads
 ng_username=your_newgrounds_username # for newgrounds
 ng_password=your_newgrounds_password
 sort_by=none   # options: none, artist, platform, genre
+platform_use_og=false   # if true, platform sorting reads og:site_name from the page instead of the domain
+sort_meta_parser=false   # if true, fall back to a full HTML parser when the quick meta tag scan misses a tag
 default_quality=best   # e.g. best, worst, 720p
 use_cwd_as_default=false   # if true, default save path is current directory
 default_download_dir=DEFAULT   # DEFAULT or absolute path (used when use_cwd_as_default=false)
+max_concurrency=4   # number of URLs downloaded at the same time
+max_parallel_downloads=4   # number of playlist entries downloaded at the same time
+max_connections_per_host=5   # upper limit of simultaneous media connections to one host
+range_parts=4   # parallel byte-range connections for large files (1 disables splitting, max 16; counted against max_connections_per_host)
+socket_rcvbuf=0   # socket receive buffer in bytes for downloads; 0 keeps the OS default (autotuning)
+threaded_writes=false   # if true, disk writes run in a separate thread so they overlap with the download (slow disks)
+meta_cache_enabled=true   # cache yt_dlp metadata on disk (needs the diskcache package)
+meta_cache_ttl=86400   # seconds a cached metadata entry stays valid
+debug=false   # set true to write DEBUG records (also from urllib3, selenium, yt_dlp) to Cerberus.log
 """
             )
         print(f"Example configuration created at {example_path}")
+    elif getattr(args, 'clear_meta_cache', False):
+        removed = clear_meta_cache()
+        print(f"Removed {removed} cached metadata entries.")
     else:
         print(f"Opening settings file at {SETTINGS_PATH}...")
         open_file(SETTINGS_PATH)
@@ -210,16 +473,110 @@ default_download_dir=DEFAULT   # DEFAULT or absolute path (used when use_cwd_as_
 # Sorting Helper
 # ================================
 
-from bs4 import BeautifulSoup
+def _meta_folder_name(value):
+    """Normalizes a meta tag value into a folder name."""
+    return value.strip().lower().replace(" ", "_") if value and value.strip() else None
+
+_WWW_PREFIX_RE = re.compile(r'^www\.', re.I)
+# Host part of an http(s) URL, cheaper than a full urlparse when only the netloc is needed
+_NETLOC_RE = re.compile(r'^https?://([^/?#]+)', re.I)
+# Number of bytes read from a page when looking up sort metadata
+_META_HEAD_BYTES = 64 * 1024
+# Cheap byte-level check for any of the meta tags used for sorting
+_META_PROBE = re.compile(rb'<meta[^>]+(?:og:site_name|name=["\'](?:author|genre))', re.I)
+# Tiny tokenizer for <meta ...> tags and their attributes
+_META_TAG_RE = re.compile(rb'<meta\b[^>]*>', re.I)
+_META_ATTR_RE = re.compile(rb'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))')
+# (attribute, value) of the meta tag that carries each sort key
+_META_KEYS = {
+    (b'property', b'og:site_name'): 'platform',
+    (b'name', b'author'): 'artist',
+    (b'name', b'genre'): 'genre',
+}
+
+def _scan_meta_tags(head, encoding):
+    """Extracts the sort meta values from raw HTML bytes without building a DOM."""
+    found = {}
+    for tag in _META_TAG_RE.finditer(head):
+        attrs = {}
+        for m in _META_ATTR_RE.finditer(tag.group(0), 5):
+            value = m.group(2) if m.group(2) is not None else m.group(3) if m.group(3) is not None else m.group(4)
+            attrs[m.group(1).lower()] = value
+        content = attrs.get(b'content')
+        if content is None:
+            continue
+        for attr in (b'property', b'name'):
+            key = _META_KEYS.get((attr, (attrs.get(attr) or b'').lower()))
+            if key and key not in found:
+                found[key] = html.unescape(content.decode(encoding, errors='ignore'))
+        if len(found) == len(_META_KEYS):
+            break
+    return found
+
+def _parse_meta_tags(head, encoding):
+    """Slow path: extracts the sort meta values with a real HTML parser (handles malformed markup)."""
+    from bs4 import BeautifulSoup, SoupStrainer, FeatureNotFound
+
+    markup = head.decode(encoding, errors='ignore')
+    # Only <meta> elements are needed for sorting; skip building the rest of the tree
+    strainer = SoupStrainer("meta")
+    try:
+        soup = BeautifulSoup(markup, "lxml", parse_only=strainer)
+    except FeatureNotFound:
+        soup = BeautifulSoup(markup, "html.parser", parse_only=strainer)
+
+    og_site = soup.find("meta", property="og:site_name")
+    author_meta = soup.find("meta", attrs={"name": "author"})
+    genre_meta = soup.find("meta", attrs={"name": "genre"})
+    return {
+        'platform': og_site.get("content") if og_site else None,
+        'artist': author_meta.get("content") if author_meta else None,
+        'genre': genre_meta.get("content") if genre_meta else None,
+    }
+
+@functools.lru_cache(maxsize=512)
+def _fetch_sort_metadata(url, use_parser=False):
+    """
+    Fetches the page once and extracts all sort-relevant meta tags.
+    Returns a dict with the keys 'platform', 'artist' and 'genre' (values may be None).
+    If use_parser is True, tags the quick scan misses are looked up with BeautifulSoup.
+    Raises on network errors so that failures are not cached.
+    """
+    # Meta tags live in <head>; only the beginning of the page is needed
+    with _get_http_session().get(url, timeout=10, stream=True,
+                                 headers={'Range': f'bytes=0-{_META_HEAD_BYTES - 1}'}) as resp:
+        resp.raise_for_status()
+        head = resp.raw.read(_META_HEAD_BYTES, decode_content=True)
+        encoding = resp.encoding or 'utf-8'
+
+    found = _scan_meta_tags(head, encoding)
+    if use_parser and len(found) < len(_META_KEYS) and _META_PROBE.search(head):
+        for key, value in _parse_meta_tags(head, encoding).items():
+            found.setdefault(key, value)
+    return {key: _meta_folder_name(found.get(key)) for key in _META_KEYS.values()}
+
+@functools.lru_cache(maxsize=256)
+def _platform_folder_from_url(url):
+    """Derives the platform folder name from the URL's domain (e.g. 'www.example.com' -> 'example')."""
+    m = _NETLOC_RE.match(url)
+    netloc = m.group(1) if m else urlparse(url).netloc
+    domain = _WWW_PREFIX_RE.sub("", netloc)
+    return domain.split(".")[0].lower()
+
+def _extract_sort_metadata(url, settings=None):
+    """Cached wrapper around _fetch_sort_metadata (the fragment is never sent to the server)."""
+    use_parser = (settings or {}).get('sort_meta_parser', 'false').lower() == 'true'
+    return dict(_fetch_sort_metadata(urldefrag(url)[0], use_parser))
 
 def sort_downloaded_file(file_path, original_url, settings):
     """
     Moves downloaded file into a subfolder based on 'sort_by' setting.
     Possible values: 'none', 'artist', 'platform', 'genre'.
 
-    - 'platform': detect site name via Open Graph 'og:site_name' or fallback to domain.
+    - 'platform': use the domain name, or the Open Graph 'og:site_name' if platform_use_og=true.
     - 'artist'/'genre': extract from meta tags <meta name="author"> or <meta name="genre">.
 
+    Page metadata is fetched once per URL and cached for the rest of the run.
     Returns the new path (or original if not moved).
     """
     sort_by = settings.get('sort_by', 'none').lower()
@@ -229,53 +586,26 @@ def sort_downloaded_file(file_path, original_url, settings):
     # Determine base download directory
     base_dir = get_default_download_dir(settings)
 
-    platform_folder = None
-    artist_folder = None
-    genre_folder = None
-
-    # Fetch and parse page once if artist/genre or OG site_name needed
-    soup = None
-    need_soup = sort_by in ("platform", "artist", "genre")
-    if need_soup:
-        try:
-            resp = requests.get(original_url, timeout=10)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-        except Exception as e:
-            log_error(f"Error fetching page for sorting: {e}")
-            soup = None
-
     # 1) PLATFORM
     if sort_by == "platform":
-        if soup:
-            og_site = soup.find("meta", property="og:site_name")
-            if og_site and og_site.get("content"):
-                platform_folder = og_site["content"].strip().lower().replace(" ", "_")
-        if not platform_folder:
-            # Fallback to domain
-            domain = urlparse(original_url).netloc
-            platform_folder = domain.replace("www.", "").split(".")[0].lower()
+        # Domain name needs no network round trip; OG site_name only on request
+        platform_folder = _platform_folder_from_url(original_url)
+        if settings.get('platform_use_og', 'false').lower() == 'true':
+            try:
+                platform_folder = _extract_sort_metadata(original_url, settings).get('platform') or platform_folder
+            except Exception as e:
+                log_error("Error fetching page for sorting: %s", e)
         dest_dir = os.path.join(base_dir, platform_folder)
 
-    # 2) ARTIST
-    elif sort_by == "artist":
-        if soup:
-            author_meta = soup.find("meta", attrs={"name": "author"})
-            if author_meta and author_meta.get("content"):
-                artist_folder = author_meta["content"].strip().lower().replace(" ", "_")
-        if not artist_folder:
-            artist_folder = "unknown_artist"
-        dest_dir = os.path.join(base_dir, artist_folder)
-
-    # 3) GENRE
-    elif sort_by == "genre":
-        if soup:
-            genre_meta = soup.find("meta", attrs={"name": "genre"})
-            if genre_meta and genre_meta.get("content"):
-                genre_folder = genre_meta["content"].strip().lower().replace(" ", "_")
-        if not genre_folder:
-            genre_folder = "unknown_genre"
-        dest_dir = os.path.join(base_dir, genre_folder)
+    # 2) ARTIST / 3) GENRE
+    elif sort_by in ("artist", "genre"):
+        try:
+            metadata = _extract_sort_metadata(original_url, settings)
+        except Exception as e:
+            log_error("Error fetching page for sorting: %s", e)
+            metadata = {}
+        folder = metadata.get(sort_by) or f"unknown_{sort_by}"
+        dest_dir = os.path.join(base_dir, folder)
 
     else:
         # Should not reach here, but fallback to base
@@ -284,17 +614,337 @@ def sort_downloaded_file(file_path, original_url, settings):
     # Ensure destination directory exists
     try:
         os.makedirs(dest_dir, exist_ok=True)
-        new_path = os.path.join(dest_dir, os.path.basename(file_path))
-        shutil.move(file_path, new_path)
-        return new_path
+        new_path = Path(dest_dir) / Path(file_path).name
+        try:
+            # Single rename syscall when source and destination share a filesystem
+            os.replace(file_path, new_path)
+        except OSError:
+            # e.g. cross-device move (EXDEV) -> copy + delete
+            shutil.move(file_path, new_path)
+        return os.fspath(new_path)
     except Exception as e:
-        log_error(f"Error moving file to sorted folder: {e}")
+        log_error("Error moving file to sorted folder: %s", e)
+        return file_path
+
+# Background pool for post-processing finished downloads (mp4 conversion, metadata lookup + move),
+# so the next download does not wait for it. Threads are started on first use.
+_SORT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cerberus-sort")
+# Running + queued post-processing jobs; submitting blocks while the backlog is full
+_SORT_BACKLOG = threading.BoundedSemaphore(8)
+
+def _convert_to_mp4(file_path, settings=None):
+    """
+    Re-encodes file_path to mp4 with ffmpeg (the equivalent of yt_dlp's FFmpegVideoConvertor).
+    A .mp4 file is converted in place; any other file is written to a free NAME.mp4 next to it
+    (claimed through resolve_available_filename) and the source is removed.
+    Returns the path of the mp4 file, or None on failure (the original file is kept).
+    """
+    base, ext = os.path.splitext(file_path)
+    if ext.lower() == ".mp4":
+        target_path = file_path
+    else:
+        if settings is None:
+            settings = get_settings()
+        overwrite_existing = settings.get('overwrite_existing', 'false').lower() == 'true'
+        target_path = resolve_available_filename(os.path.dirname(file_path), os.path.basename(base), ext=".mp4",
+                                                 overwrite_existing=overwrite_existing, claim=True)
+        if target_path is None:
+            log_error("Not converting %s: %s.mp4 already exists", file_path, base)
+            return None
+    temp_path = base + ".convert.mp4"
+    cmd = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+           "-i", file_path, "-map", "0", "-dn", "-ignore_unknown", temp_path]
+    try:
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if proc.returncode == 0 and os.path.exists(temp_path):
+            os.replace(temp_path, target_path)
+            if target_path != file_path:
+                os.remove(file_path)
+            return target_path
+        stderr = proc.stderr.decode(errors='ignore') if proc.stderr else ''
+        log_error("ffmpeg conversion failed (rc=%s) for %s. stderr: %s", proc.returncode, file_path, stderr[:1000])
+    except Exception as e:
+        log_error("ffmpeg conversion error for %s: %s", file_path, e)
+    finally:
+        if target_path != file_path:
+            _release_filenames(target_path)
+    try:
+        os.remove(temp_path)
+    except OSError:
+        pass
+    return None
+
+def _sort_job(file_path, original_url, settings, convert=False):
+    """Converts (if requested) and sorts a downloaded file unless an abort was requested in the meantime."""
+    if _get_stop_event().is_set():
+        return file_path
+    if convert:
+        file_path = _convert_to_mp4(file_path, settings) or file_path
+    return sort_downloaded_file(file_path, original_url, settings)
+
+def _submit_sort(file_path, original_url, settings, convert=False):
+    """
+    Schedules post-processing of a downloaded file. Blocks while the backlog is full.
+    Returns a Future, or None if the pool is shut down.
+    """
+    _SORT_BACKLOG.acquire()
+    try:
+        job = _SORT_POOL.submit(_sort_job, file_path, original_url, settings, convert)
+    except RuntimeError:
+        _SORT_BACKLOG.release()
+        return None
+    job.add_done_callback(lambda _: _SORT_BACKLOG.release())
+    return job
+
+def _sorted_path(job, file_path):
+    """Waits for a job from _submit_sort and returns the final path (file_path if not moved)."""
+    if job is None:
+        return file_path
+    try:
+        return job.result() or file_path
+    except Exception:
         return file_path
 
+# ================================
+# yt_dlp Metadata Cache
+# ================================
+
+_META_CACHE = None
+_META_CACHE_LOCK = threading.Lock()
+_META_CACHE_TAG = 'ytmeta'
+_INFO_KEYS = ('id', 'title', 'fulltitle', 'webpage_url', 'url', 'ext', 'duration', 'filesize', 'filesize_approx')
+_FORMAT_KEYS = ('url', 'ext', 'format_id', 'height', 'tbr', 'filesize', 'filesize_approx', 'duration')
+
+def _get_meta_cache():
+    """Returns the on-disk metadata cache, or None if diskcache is not installed."""
+    global _META_CACHE
+    if _META_CACHE is None:
+        with _META_CACHE_LOCK:
+            if _META_CACHE is None:
+                try:
+                    from diskcache import Cache
+                    _META_CACHE = Cache(os.fspath(CONFIG_DIR / "cache" / _META_CACHE_TAG))
+                except Exception as e:
+                    log_info("Metadata cache disabled: %s", e)
+                    _META_CACHE = False
+    return _META_CACHE if _META_CACHE is not False else None
+
+# Reusable YoutubeDL instances for metadata extraction and fallback downloads, one per thread
+# and option set (YoutubeDL is not safe for concurrent use). A thread's instances are closed
+# when the thread exits (e.g. when a playlist's worker pool shuts down), the rest at interpreter exit.
+_YDL_LOCAL = threading.local()
+
+def _close_ydls(instances):
+    """Closes and drops the YoutubeDL instances in the dict."""
+    for ydl in instances.values():
+        try:
+            ydl.close()
+        except Exception:
+            pass
+    instances.clear()
+
+class _ThreadYdls:
+    """Holder for one thread's YoutubeDL instances; closes them once the thread drops it."""
+
+    def __init__(self):
+        self.instances = {}
+        weakref.finalize(self, _close_ydls, self.instances)
+
+def _thread_ydl(key, opts):
+    """Returns this thread's YoutubeDL instance for key, created with opts on first use."""
+    holder = getattr(_YDL_LOCAL, 'holder', None)
+    if holder is None:
+        holder = _YDL_LOCAL.holder = _ThreadYdls()
+    ydl = holder.instances.get(key)
+    if ydl is None:
+        import yt_dlp
+        ydl = holder.instances[key] = yt_dlp.YoutubeDL(opts)
+    return ydl
+
+def _get_info_ydl(quality):
+    """Returns this thread's YoutubeDL instance for extract_info with the given format."""
+    return _thread_ydl(('info', quality), {'quiet': True, 'format': quality})
+
+def _get_fallback_ydl(quality, yt_verbose, settings):
+    """
+    Returns this thread's YoutubeDL instance for per-entry fallback downloads with these options.
+    Callers set params['outtmpl']['default'] to the target path before each download.
+    """
+    opts = {
+        'outtmpl': '%(title)s.%(ext)s',
+        'format': quality,
+        'noplaylist': True,
+        'quiet': not yt_verbose,
+        'no_warnings': True,
+        'progress_hooks': [ytdlp_progress_hook],
+        'useragent': settings.get('user_agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'),
+        # mp4 conversion runs in the post-processing pool so the worker can start the next entry
+        'socket_timeout': int(settings.get('socket_timeout', 60)),
+        'retries': int(settings.get('retries', 10)),
+    }
+    if settings.get('cookies_file'):
+        opts['cookiefile'] = settings['cookies_file']
+    if settings.get('proxy'):
+        opts['proxy'] = settings['proxy']
+    if settings.get('ignoreerrors', 'false').lower() == 'true':
+        opts['ignoreerrors'] = True
+
+    key = ('fallback',) + tuple((k, v) for k, v in opts.items() if k != 'progress_hooks')
+    return _thread_ydl(key, opts)
+
+def _prune_info(info):
+    """Reduces a yt_dlp info dict to the JSON-serialisable fields the downloader uses."""
+    pruned = {key: info[key] for key in _INFO_KEYS if info.get(key) is not None}
+    for key in ('formats', 'requested_formats'):
+        if info.get(key):
+            pruned[key] = [{k: f[k] for k in _FORMAT_KEYS if f.get(k) is not None} for f in info[key]]
+    if info.get('entries'):
+        pruned['entries'] = [_prune_info(e) for e in info['entries'] if e]
+    return pruned
+
+_MEDIA_URL_CACHE_TAG = 'media_urls'
+# Resolved media URLs are usually signed, so they are only kept for an hour
+_MEDIA_URL_CACHE_TTL = 3600
+_EXPIRY_PARAMS = ('expire', 'expires')
+
+def _signed_url_remaining(media_url):
+    """Seconds until a signed URL expires ('expire'/'Expires' query parameter), or None if unsigned."""
+    for key, values in parse_qs(urlparse(media_url).query).items():
+        if key.lower() in _EXPIRY_PARAMS and values and values[0].isdigit():
+            return int(values[0]) - time.time()
+    return None
+
+def _info_urls(info):
+    """Yields every media URL in a pruned info dict."""
+    if info.get('url'):
+        yield info['url']
+    for key in ('formats', 'requested_formats'):
+        for f in info.get(key) or ():
+            if f.get('url'):
+                yield f['url']
+    for entry in info.get('entries') or ():
+        yield from _info_urls(entry)
+
+def _cached_extract(url, quality, ydl=None, settings=None):
+    """
+    Returns the pruned yt_dlp info dict for url (extract_info with download=False).
+    Results are kept on disk for 'meta_cache_ttl' seconds, keyed by (url, quality).
+    Uses ydl if given, otherwise this thread's pooled YoutubeDL instance.
+    """
+    if settings is None:
+        settings = get_settings()
+    cache = None
+    if settings.get('meta_cache_enabled', 'true').lower() == 'true':
+        cache = _get_meta_cache()
+    key = (url, quality)
+    if cache is not None:
+        info = cache.get(key)
+        if info is not None:
+            return info
+
+    if ydl is None:
+        ydl = _get_info_ydl(quality)
+    info = ydl.extract_info(url, download=False)
+    if not info:
+        return None
+    info = _prune_info(info)
+
+    if cache is not None:
+        try:
+            ttl = int(settings.get('meta_cache_ttl', 86400))
+        except ValueError:
+            ttl = 86400
+        # never keep signed media URLs past their expiry
+        remaining = [r for r in map(_signed_url_remaining, _info_urls(info)) if r is not None]
+        if remaining:
+            ttl = min(ttl, int(min(remaining)))
+        try:
+            if ttl > 0:
+                cache.set(key, info, expire=ttl, tag=_META_CACHE_TAG)
+        except Exception as e:
+            log_error("Could not write metadata cache: %s", e)
+    return info
+
+def _cached_direct(entry, entry_url, quality, ydl_instance=None, settings=None):
+    """
+    get_direct_media_url with a disk cache for entries that need a re-extraction.
+    (entry URL, entry id, quality) -> (media_url, meta) is kept for up to an hour; URLs whose
+    signature expires within that hour are not cached. yt_dlp ids are only unique per extractor,
+    so the URL scopes the key to its site and the id tells apart entries sharing the playlist URL.
+    """
+    if entry.get('url') or entry.get('formats') or entry.get('requested_formats'):
+        # resolved from the entry itself, nothing to save
+        return get_direct_media_url(entry, entry_url, quality=quality, ydl_instance=ydl_instance)
+
+    if settings is None:
+        settings = get_settings()
+    cache = None
+    if settings.get('meta_cache_enabled', 'true').lower() == 'true':
+        cache = _get_meta_cache()
+    key = ('media', entry_url, entry.get('id'), quality)
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached['media_url'], cached['meta']
+
+    media_url, meta = get_direct_media_url(entry, entry_url, quality=quality, ydl_instance=ydl_instance)
+    if cache is not None and media_url:
+        remaining = _signed_url_remaining(media_url)
+        if remaining is None or remaining >= _MEDIA_URL_CACHE_TTL:
+            try:
+                cache.set(key, {'media_url': media_url, 'meta': meta},
+                          expire=_MEDIA_URL_CACHE_TTL, tag=_MEDIA_URL_CACHE_TAG)
+            except Exception as e:
+                log_error("Could not write media URL cache: %s", e)
+    return media_url, meta
+
+def clear_meta_cache():
+    """Removes all cached yt_dlp metadata and media URLs. Returns the number of removed entries."""
+    cache = _get_meta_cache()
+    if cache is None:
+        return 0
+    return cache.evict(_META_CACHE_TAG) + cache.evict(_MEDIA_URL_CACHE_TAG)
+
 # ================================
 # Download Functions
 # ================================
 
+def _download_playlist_entry(entry_url, media_url, target_path, quality, yt_verbose, settings):
+    """
+    Downloads a single playlist entry to target_path (direct media URL first, yt_dlp as fallback)
+    and schedules post-processing. Returns (saved_path, sort_job) or None on failure.
+    """
+    if _get_stop_event().is_set():
+        return None
+
+    if media_url:
+        if download_media_url(media_url, target_path, settings, original_page_url=entry_url):
+            return target_path, _submit_sort(target_path, entry_url, settings)
+        if _get_stop_event().is_set():
+            # aborted, not failed: do not start the yt_dlp fallback
+            return None
+        log_error("Failed to download media_url for entry: %s", media_url)
+        print_if_not_ignored(f"Failed to download media_url for entry: {media_url}", settings)
+        # try fallback to yt_dlp once for this entry
+
+    # Controlled yt_dlp download for this entry (prevents playlist-appended suffixes)
+    try:
+        ydl_single = _get_fallback_ydl(quality, yt_verbose, settings)
+        ydl_single.params['outtmpl']['default'] = target_path
+        entry_info = ydl_single.extract_info(entry_url, download=True)
+    except Exception as e:
+        log_error("Fallback yt_dlp download failed for entry %s: %s", entry_url, e)
+        print_if_not_ignored(f"Fallback yt_dlp download failed for entry {entry_url}: {e}", settings)
+        return None
+    convert = bool(entry_info) and (entry_info.get('ext') or 'mp4') != 'mp4'
+    return target_path, _submit_sort(target_path, entry_url, settings, convert=convert)
+
+def _entry_key(entry):
+    """Stable identity of a playlist entry: id, page URL or URL, else (title, duration, size)."""
+    return (entry.get('id') or entry.get('webpage_url') or entry.get('url')
+            or ((entry.get('title') or '').strip(), entry.get('duration'),
+                entry.get('filesize') or entry.get('filesize_approx')))
+
 def download_with_youtube_dl(video_url, save_folder, custom_name=None, quality=None, session_key=None, overwrite_existing=None):
     """
     Robust yt_dlp handler:
@@ -302,11 +952,12 @@ def download_with_youtube_dl(video_url, save_folder, custom_name=None, quality=N
      - deduplicates entries (stable key)
      - determines real media URLs (prefer entry fields first)
      - downloads each distinct media resource exactly once
+       (up to 'max_parallel_downloads' entries at the same time)
      - uses resolve_available_filename for session-local numbering (NAME, NAME(1), ...)
      - falls back to yt_dlp.download per-entry only if direct media URL cannot be determined
     Returns last downloaded path or None.
     """
-    settings = load_settings(SETTINGS_PATH)
+    settings = get_settings()
     yt_verbose = settings.get('yt_verbose', 'false').lower() == 'true'
     # Wenn yt_verbose True => show internal yt_dlp logs (quiet=False)
 # Wenn False => suppress internal logs and rely on progress hook (quiet=True)
@@ -317,11 +968,9 @@ def download_with_youtube_dl(video_url, save_folder, custom_name=None, quality=N
 
     # Try to extract info once
     try:
-        import yt_dlp
-        with yt_dlp.YoutubeDL({'quiet': True, 'format': quality}) as ydl:
-            info = ydl.extract_info(video_url, download=False)
+        info = _cached_extract(video_url, quality, settings=settings)
     except Exception as e:
-        log_error(f"yt_dlp extract_info error: {e}")
+        log_error("yt_dlp extract_info error: %s", e)
         info = None
 
     # Determine base title
@@ -336,43 +985,29 @@ def download_with_youtube_dl(video_url, save_folder, custom_name=None, quality=N
 
     # Playlist / multiple entries handling
     if info and info.get('entries'):
-        raw_entries = [e for e in info.get('entries') if e]
-        # stable dedupe by key
-        seen_keys = set()
-        unique_entries = []
-        for e in raw_entries:
-            key = e.get('id') or e.get('webpage_url') or e.get('url')
-            if not key:
-                title = (e.get('title') or '').strip()
-                dur = str(e.get('duration') or '')
-                fs = str(e.get('filesize') or e.get('filesize_approx') or '')
-                key = f"{title}|{dur}|{fs}"
-            if key in seen_keys:
-                continue
-            seen_keys.add(key)
-            unique_entries.append(e)
+        # stable dedupe by key (first occurrence wins, order preserved)
+        by_key = {}
+        for e in info.get('entries'):
+            if e:
+                by_key.setdefault(_entry_key(e), e)
+        unique_entries = list(by_key.values())
 
         # Reusable ydl instance for targeted re-extraction if needed
-        import yt_dlp
-        ydl_for_info = yt_dlp.YoutubeDL({'quiet': True, 'format': quality})
+        ydl_for_info = _get_info_ydl(quality)
 
         media_seen = set()
-        final_paths = []
+        planned_paths = set()
+        tasks = []
 
+        # Resolve media URLs and target filenames serially so numbering stays deterministic
         for idx, entry in enumerate(unique_entries):
             entry_url = entry.get('webpage_url') or entry.get('url') or video_url
 
             # Try to get media_url from entry, prefer non-extractive access
-            media_url, meta = get_direct_media_url(entry, entry_url, quality=quality, ydl_instance=ydl_for_info)
-
-            # If still no media_url, mark for controlled yt_dlp fallback (we will still dedupe by entry key)
-            used_fallback_ydl_download = False
-            if not media_url:
-                # we will use yt_dlp to download this entry directly (outtmpl below)
-                used_fallback_ydl_download = True
+            media_url, meta = _cached_direct(entry, entry_url, quality, ydl_instance=ydl_for_info, settings=settings)
 
             # Deduplicate by media_url (if available), else by entry key
-            dedupe_key = media_url if media_url else (entry.get('id') or entry.get('webpage_url') or entry.get('url'))
+            dedupe_key = media_url or _entry_key(entry)
             if dedupe_key in media_seen:
                 continue
             media_seen.add(dedupe_key)
@@ -383,97 +1018,55 @@ def download_with_youtube_dl(video_url, save_folder, custom_name=None, quality=N
             ext = (meta.get('ext') or 'mp4').lstrip('.')
             target_path = resolve_available_filename(save_folder, candidate_base, ext='.' + ext,
                                                      overwrite_existing=overwrite_existing,
-                                                     session_key=session_key or video_url)
+                                                     session_key=session_key or video_url,
+                                                     reserved=planned_paths, claim=True)
             if target_path is None:
                 print_if_not_ignored(f"Skipping existing file: {os.path.join(save_folder, candidate_base + '.' + ext)}", settings)
                 continue
+            planned_paths.add(target_path)
+            tasks.append((entry_url, media_url, target_path))
 
-            saved_path = None
-            if not used_fallback_ydl_download:
-                ok = download_media_url(media_url, target_path, settings, original_page_url=entry_url)
-                if not ok:
-                    log_error(f"Failed to download media_url for entry: {media_url}")
-                    print_if_not_ignored(f"Failed to download media_url for entry: {media_url}", settings)
-                    # try fallback to yt_dlp once for this entry
-                    used_fallback_ydl_download = True
-                else:
-                    saved_path = target_path
-
-            if used_fallback_ydl_download:
-                # Controlled yt_dlp download for this entry (prevents playlist-appended suffixes)
-                ydl_opts_entry = {
-                    'outtmpl': target_path,
-                    'format': quality,
-                    'noplaylist': True,
-                    'quiet': not yt_verbose,
-                    'no_warnings': True,
-                    'progress_hooks': [ytdlp_progress_hook],
-                    'useragent': settings.get('user_agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'),
-                    'postprocessors': [{'key': 'FFmpegVideoConvertor', 'preferedformat': 'mp4'}],
-                    'socket_timeout': int(settings.get('socket_timeout', 60)),
-                    'retries': int(settings.get('retries', 10)),
-                }
-                if settings.get('cookies_file'):
-                    ydl_opts_entry['cookiefile'] = settings['cookies_file']
-                if settings.get('proxy'):
-                    ydl_opts_entry['proxy'] = settings['proxy']
-                if settings.get('ignoreerrors', 'false').lower() == 'true':
-                    ydl_opts_entry['ignoreerrors'] = True
-                try:
-                    with yt_dlp.YoutubeDL(ydl_opts_entry) as ydl_single:
-                        ydl_single.download([entry_url])
-                    saved_path = target_path
-                except Exception as e:
-                    log_error(f"Fallback yt_dlp download failed for entry {entry_url}: {e}")
-                    print_if_not_ignored(f"Fallback yt_dlp download failed for entry {entry_url}: {e}", settings)
-                    continue
-
-            # Postprocess / sort
-            try:
-                moved = sort_downloaded_file(saved_path, entry_url, settings)
-                if moved and moved != saved_path:
-                    final_paths.append(moved)
-                else:
-                    final_paths.append(saved_path)
-            except Exception:
-                final_paths.append(saved_path)
-
+        # Download the entries in parallel; sorting runs in the background as each one finishes
         try:
-            ydl_for_info.close()
-        except Exception:
-            pass
+            max_workers = max(1, int(settings.get('max_parallel_downloads', 4)))
+        except ValueError:
+            max_workers = 4
+        results = [None] * len(tasks)
+        try:
+            if tasks:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+                    futures = {
+                        executor.submit(_download_playlist_entry, entry_url, media_url, target_path,
+                                        quality, yt_verbose, settings): i
+                        for i, (entry_url, media_url, target_path) in enumerate(tasks)
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            results[futures[future]] = future.result()
+                        except Exception as e:
+                            log_error("Error downloading playlist entry: %s", e)
+        finally:
+            _release_filenames(*planned_paths)
 
+        final_paths = [_sorted_path(job, saved_path) for saved_path, job in filter(None, results)]
         return final_paths[-1] if final_paths else None
 
     # Single item fallback (not playlist)
-    target_path = resolve_available_filename(save_folder, base_title, ext=".mp4", overwrite_existing=overwrite_existing, session_key=session_key or video_url)
+    target_path = resolve_available_filename(save_folder, base_title, ext=".mp4", overwrite_existing=overwrite_existing, session_key=session_key or video_url, claim=True)
     if target_path is None:
         print_if_not_ignored(f"Skipping existing file: {os.path.join(save_folder, base_title + '.mp4')}", settings)
         return None
 
-    ydl_opts = {
-        'outtmpl': target_path,
-        'format': quality,
-        'noplaylist': True,
-        'quiet': not yt_verbose,
-        'no_warnings': True,
-        'progress_hooks': [ytdlp_progress_hook],
-        'useragent': settings.get('user_agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'),
-        'postprocessors': [{'key': 'FFmpegVideoConvertor', 'preferedformat': 'mp4'}],
-        'socket_timeout': int(settings.get('socket_timeout', 60)),
-        'retries': int(settings.get('retries', 10)),
-    }
-    if settings.get('cookies_file'):
-        ydl_opts['cookiefile'] = settings['cookies_file']
-    if settings.get('proxy'):
-        ydl_opts['proxy'] = settings['proxy']
-    if settings.get('ignoreerrors', 'false').lower() == 'true':
-        ydl_opts['ignoreerrors'] = True
-
     try:
-        import yt_dlp
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([video_url])
+        try:
+            # Reuse this thread's YoutubeDL (extractors and cookie jar are set up once)
+            ydl = _get_fallback_ydl(quality, yt_verbose, settings)
+            ydl.params['outtmpl']['default'] = target_path
+            info = ydl.extract_info(video_url, download=True)
+            if info and (info.get('ext') or 'mp4') != 'mp4':
+                _convert_to_mp4(target_path, settings)
+        finally:
+            _release_filenames(target_path)
         try:
             final_path = sort_downloaded_file(target_path, video_url, settings)
             if final_path and final_path != target_path:
@@ -482,62 +1075,295 @@ def download_with_youtube_dl(video_url, save_folder, custom_name=None, quality=N
         except Exception:
             return target_path
     except Exception as e:
-        log_error(f"Error downloading video with yt_dlp: {e}")
+        log_error("Error downloading video with yt_dlp: %s", e)
         print_if_not_ignored(f"Error downloading video with yt_dlp: {e}", settings)
         return None
 
-def download_video(video_url, save_path):
-    """Downloads a video from a URL using HTTP."""
-    settings = load_settings(SETTINGS_PATH)
+# Files smaller than this are fetched over a single connection
+_RANGED_MIN_SIZE = 8 * 1024 * 1024
+# Upper bound for 'range_parts' (one thread and one connection per part)
+_MAX_RANGE_PARTS = 16
+
+def _range_parts(value):
+    """Parses a 'range_parts' value, clamped to 1.._MAX_RANGE_PARTS (default 4)."""
+    try:
+        return min(max(1, int(value)), _MAX_RANGE_PARTS)
+    except (TypeError, ValueError):
+        return 4
+
+def _probe_ranged_size(url, headers=None):
+    """
+    Sends a HEAD request and returns (size, final_url): the Content-Length if the server accepts
+    byte ranges, otherwise 0, and the URL after redirects, so later requests skip the redirect hop.
+    """
     try:
-        response = requests.get(video_url, stream=True)
-        response.raise_for_status()
+        r = _get_http_session().head(url, headers=headers, allow_redirects=True, timeout=10)
+        if r.status_code != 200:
+            return 0, url
+        if r.headers.get('accept-ranges', '').lower() != 'bytes':
+            return 0, r.url or url
+        return int(r.headers.get('content-length', 0) or 0), r.url or url
+    except Exception:
+        return 0, url
 
-        total_size = int(response.headers.get('content-length', 0))
-        block_size = 8192
-        progress = tqdm(total=total_size, unit='iB', unit_scale=True, unit_divisor=1024, desc=os.path.basename(save_path))
+def _download_ranges(url, save_path, total_size, parts, headers=None, on_progress=None):
+    """
+    Downloads url into save_path using `parts` parallel HTTP Range requests on the shared session.
+    Each worker writes its slice at the matching offset of a pre-allocated file.
+    on_progress(n) is called (under a lock) with the number of bytes written.
+    Returns True on success; on failure the partial file is removed and False is returned.
+    """
+    session = _get_http_session()
+    part_size = -(-total_size // parts)
+    bounds = [(lo, min(lo + part_size, total_size) - 1) for lo in range(0, total_size, part_size)]
+    progress_lock = threading.Lock()
+    stop_event = _get_stop_event()
+    # set by the first failing part so its siblings stop instead of finishing their slices
+    failed = threading.Event()
+
+    def fetch(lo, hi):
+        try:
+            _fetch(lo, hi)
+        except BaseException:
+            failed.set()
+            raise
+
+    def _fetch(lo, hi):
+        if failed.is_set():
+            raise IOError("another part failed")
+        range_headers = dict(headers or {})
+        range_headers['Range'] = f'bytes={lo}-{hi}'
+        with session.get(url, headers=range_headers, stream=True, timeout=(10, 60)) as r:
+            if r.status_code != 206:
+                raise IOError(f"server ignored Range request (HTTP {r.status_code})")
+            pos = lo
+            with open(save_path, 'r+b') as fh:
+                fh.seek(lo)
+                for chunk in r.iter_content(chunk_size=256 * 1024):
+                    if stop_event.is_set():
+                        raise IOError("download aborted")
+                    if failed.is_set():
+                        raise IOError("another part failed")
+                    fh.write(chunk)
+                    pos += len(chunk)
+                    if on_progress:
+                        with progress_lock:
+                            on_progress(len(chunk))
+        if pos != hi + 1:
+            raise IOError(f"incomplete range {lo}-{hi} ({pos - lo} bytes)")
 
-        with open(save_path, 'wb') as file:
-            for chunk in response.iter_content(chunk_size=block_size):
-                if stop_download.is_set():
-                    print("\nDownload aborted.")
-                    return None
-                file.write(chunk)
-                progress.update(len(chunk))
-
-        progress.close()
-        if total_size != 0 and progress.n != total_size:
-            print(f"Warning: Download may be incomplete. ({progress.n}/{total_size})")
-        log_info(f"Video successfully downloaded: {save_path}")
-        print(f"\nVideo successfully downloaded: {save_path}")
-        final_path = sort_downloaded_file(save_path, video_url, settings)
-        if final_path != save_path:
-            print(f"Moved to sorted folder: {final_path}")
-        return final_path
+    try:
+        # Pre-allocate so the workers can write their slices in place
+        with open(save_path, 'wb') as fh:
+            if hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(fh.fileno(), 0, total_size)
+                except OSError:
+                    fh.truncate(total_size)
+            else:
+                fh.truncate(total_size)
+        with ThreadPoolExecutor(max_workers=min(len(bounds), _MAX_RANGE_PARTS)) as executor:
+            for future in [executor.submit(fetch, lo, hi) for lo, hi in bounds]:
+                future.result()
+        return True
     except Exception as e:
-        log_error(f"Error downloading video: {e}")
+        log_info("Ranged download of %s failed: %s", url, e)
+        try:
+            os.remove(save_path)
+        except OSError:
+            pass
+        return False
+
+def download_video(video_url, save_path):
+    """Downloads a video from a URL using HTTP."""
+    return download_video_ranged(video_url, save_path)
+
+def download_video_ranged(video_url, save_path, parts=None):
+    """
+    Downloads a video from a URL using HTTP, split into `parts` parallel byte-range requests
+    (default: 'range_parts' setting, 4) when the server supports ranges and the file is large.
+    Falls back to a single streamed request otherwise.
+    """
+    settings = get_settings()
+    try:
+        parts = _range_parts(settings.get('range_parts', 4) if parts is None else parts)
+        slot = _host_slot(video_url, settings)
+        with slot:
+            # every extra part is one more connection to the host; only use free slots
+            extra = _borrow_host_slots(slot, parts - 1)
+            try:
+                total_size, fetch_url = _probe_ranged_size(video_url) if extra else (0, video_url)
+                if total_size >= _RANGED_MIN_SIZE:
+                    progress = _progress_bar(total_size, save_path)
+                    ok = _download_ranges(fetch_url, save_path, total_size, 1 + extra, on_progress=progress.update)
+                    progress.close()
+                    if ok:
+                        log_info("Video successfully downloaded: %s", save_path)
+                        print(f"\nVideo successfully downloaded: {save_path}")
+                        final_path = sort_downloaded_file(save_path, video_url, settings)
+                        if final_path != save_path:
+                            print(f"Moved to sorted folder: {final_path}")
+                        return final_path
+                    if _get_stop_event().is_set():
+                        print("\nDownload aborted.")
+                        return None
+            finally:
+                for _ in range(extra):
+                    slot.release()
+            return _download_video_stream(video_url, save_path, settings)
+    except Exception as e:
+        log_error("Error downloading video: %s", e)
         print_if_not_ignored(f"Error downloading video: {e}", settings)
         return None
 
-INVALID_WIN_CHARS = r'<>:"/\\|?*\x00-\x1f'
-INVALID_RE = re.compile(f'[{re.escape("<>:\"/\\\\|?*")}\x00-\x1f]')
+class _ProgressReader:
+    """
+    Read-only wrapper around a response's raw stream for shutil.copyfileobj.
+    Reports bytes read to on_progress(n) in batches (flush_bytes or 200 ms) and
+    returns EOF as soon as the stop event is set.
+    """
+
+    def __init__(self, raw, on_progress, flush_bytes=1 << 20):
+        self._raw = raw
+        self._on_progress = on_progress
+        self._flush_bytes = flush_bytes
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def read(self, size=-1):
+        if _get_stop_event().is_set():
+            return b''
+        data = self._raw.read(size)
+        self._pending += len(data)
+        if not data or self._pending >= self._flush_bytes or time.monotonic() - self._last_flush > 0.2:
+            self.flush()
+        return data
+
+    def readinto(self, b):
+        if _get_stop_event().is_set():
+            return 0
+        n = self._raw.readinto(b)
+        self._pending += n
+        if not n or self._pending >= self._flush_bytes or time.monotonic() - self._last_flush > 0.2:
+            self.flush()
+        return n
+
+    def flush(self):
+        if self._pending:
+            self._on_progress(self._pending)
+            self._pending = 0
+        self._last_flush = time.monotonic()
+
+def _copy_into(reader, fh, block_size):
+    """
+    Copies reader to fh through one reused buffer of block_size bytes (readinto + memoryview),
+    so no new bytes object is allocated per block. fh should be unbuffered.
+    """
+    buf = memoryview(bytearray(block_size))
+    readinto = reader.readinto
+    write = fh.write
+    while True:
+        n = readinto(buf)
+        if not n:
+            break
+        view = buf[:n]
+        while view:
+            view = view[write(view):]
+
+class _BackgroundWriter:
+    """
+    Write-only wrapper that hands blocks to a writer thread, so the next network read can
+    proceed while the previous block is written to disk. At most two blocks are in flight.
+    close() waits for all pending writes and re-raises a write error.
+    """
+
+    def __init__(self, fh):
+        import queue
+
+        self._fh = fh
+        self._queue = queue.Queue(maxsize=2)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="cerberus-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            block = self._queue.get()
+            if block is None:
+                return
+            if self._error is None:
+                try:
+                    # fh may be unbuffered, where write() can take only part of the block
+                    view = memoryview(block)
+                    while view:
+                        view = view[self._fh.write(view):]
+                except Exception as e:
+                    self._error = e
+
+    def write(self, block):
+        if self._error is not None:
+            raise self._error
+        self._queue.put(block)
+        return len(block)
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+def _progress_bar(total_size, save_path):
+    """
+    tqdm byte counter for save_path. Redraws at most twice a second, so fast links do not
+    spend download-thread time on terminal writes.
+    """
+    from tqdm import tqdm
+
+    return tqdm(total=total_size, unit='iB', unit_scale=True, unit_divisor=1024,
+                desc=os.path.basename(save_path), mininterval=0.5, smoothing=0.1)
+
+def _download_video_stream(video_url, save_path, settings):
+    """Streams video_url to save_path with a tqdm progress bar and sorts the result."""
+    response = _get_http_session().get(video_url, stream=True)
+    response.raise_for_status()
+
+    total_size = int(response.headers.get('content-length', 0))
+    progress = _progress_bar(total_size, save_path)
+
+    # Copy the raw stream through a reused 1 MiB buffer; urllib3 still undoes any Content-Encoding
+    response.raw.decode_content = True
+    reader = _ProgressReader(response.raw, progress.update)
+    with response, open(save_path, 'wb', buffering=0) as file:
+        _copy_into(reader, file, 1 << 20)
+    reader.flush()
+    if _get_stop_event().is_set():
+        print("\nDownload aborted.")
+        return None
+
+    progress.close()
+    if total_size != 0 and progress.n != total_size:
+        print(f"Warning: Download may be incomplete. ({progress.n}/{total_size})")
+    log_info("Video successfully downloaded: %s", save_path)
+    print(f"\nVideo successfully downloaded: {save_path}")
+    final_path = sort_downloaded_file(save_path, video_url, settings)
+    if final_path != save_path:
+        print(f"Moved to sorted folder: {final_path}")
+    return final_path
+
+# Characters invalid in Windows/Linux file names -> '_', control characters -> removed
+_SANITIZE_TABLE = {ord(c): '_' for c in '<>:"/\\|?*'}
+_SANITIZE_TABLE.update({c: None for c in range(32)})
 
 def sanitize_filename(name, max_length=200):
     """
     Entfernt/ersetzt ungültige Dateiname-Zeichen für Windows/Linux.
-    - ersetzt ungültige Zeichen durch '_' und kürzt Länge
+    - ersetzt ungültige Zeichen durch '_', entfernt Steuerzeichen und kürzt Länge
     - entfernt führende/trailing Whitespace und Punkt
     """
     if not name:
         return "video"
-    # normalize whitespace
-    s = str(name).strip()
-    # replace invalid chars
-    s = INVALID_RE.sub("_", s)
-    # remove control chars explicitly
-    s = ''.join(ch for ch in s if ord(ch) >= 32)
-    # Trim trailing dots/spaces (Windows problem)
-    s = s.rstrip(". ")
+    # one pass: strip whitespace, map invalid chars, trim trailing dots/spaces (Windows problem)
+    s = str(name).strip().translate(_SANITIZE_TABLE).rstrip(". ")
     # Limit length (keep extension space later)
     if len(s) > max_length:
         s = s[:max_length].rstrip()
@@ -548,6 +1374,9 @@ def sanitize_filename(name, max_length=200):
 
 def extract_video_name(driver):
     """Extracts the title of the video from the page."""
+    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import NoSuchWindowException
+
     try:
         title_element = driver.find_element(By.TAG_NAME, 'title')
         video_title = title_element.get_attribute('innerText')
@@ -557,11 +1386,14 @@ def extract_video_name(driver):
         print("The browser window closed unexpectedly.")
         raise
     except Exception as e:
-        log_error(f"Error extracting video title: {e}")
+        log_error("Error extracting video title: %s", e)
         return "video"
 
 def extract_main_video_url(driver):
     """Searches for and extracts the main video URL from the page."""
+    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import NoSuchElementException
+
     try:
         video_element = driver.find_element(By.TAG_NAME, 'video')
         video_url = video_element.get_attribute('src')
@@ -574,7 +1406,7 @@ def extract_main_video_url(driver):
         print("No video tag found on the page.")
         return None
     except Exception as e:
-        log_error(f"Error extracting main video URL: {e}")
+        log_error("Error extracting main video URL: %s", e)
         return None
 
 def check_file_exists(save_path, overwrite_existing):
@@ -582,7 +1414,7 @@ def check_file_exists(save_path, overwrite_existing):
     Checks if the file exists.
     If overwrite_existing is True, the file is not skipped but overwritten.
     """
-    settings = load_settings(SETTINGS_PATH)
+    settings = get_settings()
     if isinstance(overwrite_existing, str):
         overwrite_existing = overwrite_existing.lower() == 'true'
     if os.path.exists(save_path):
@@ -600,6 +1432,39 @@ def check_file_exists(save_path, overwrite_existing):
             return True
     return False
 
+_DEFAULT_KNOWN_HOSTS = ("youtube.com", "pornhub.com")
+
+@functools.lru_cache(maxsize=8)
+def _known_hosts(custom_hosts_str):
+    """
+    Splits the known hosts (defaults + 'custom_hosts' setting) into a set of domains and
+    a tuple of entries containing a path, which are still matched as substrings of the URL.
+    """
+    hosts = set(_DEFAULT_KNOWN_HOSTS)
+    patterns = []
+    for host in custom_hosts_str.split(","):
+        host = host.strip().lower()
+        if not host:
+            continue
+        if "/" in host:
+            patterns.append(host)
+        else:
+            hosts.add(_WWW_PREFIX_RE.sub("", host))
+    return frozenset(hosts), tuple(patterns)
+
+def _is_known_host(url, custom_hosts_str):
+    """True if url's host is a known host or a subdomain of one (yt_dlp is used directly)."""
+    hosts, patterns = _known_hosts(custom_hosts_str or "")
+    m = _NETLOC_RE.match(url)
+    netloc = m.group(1) if m else urlparse(url).netloc
+    domain = _WWW_PREFIX_RE.sub("", netloc.rsplit("@", 1)[-1].split(":", 1)[0].lower())
+    if domain in hosts or any(domain.endswith("." + host) for host in hosts):
+        return True
+    return any(pattern in url.lower() for pattern in patterns)
+
+# URL fragments that mark a network response as downloadable media
+_MEDIA_EXTS = ('.mp4', '.m3u8', '.wav')
+
 def download_video_from_page(url, browser_path, save_folder, video_index, total_videos,
                              minimize_browser, overwrite_existing, custom_name=None, force=False, quality=None):
     """
@@ -613,18 +1478,19 @@ def download_video_from_page(url, browser_path, save_folder, video_index, total_
       - Newgrounds-specific: if URL contains 'newgrounds.com/portal/view', handle login.
     Returns the final saved path (or None).
     """
-    settings = load_settings(SETTINGS_PATH)
+    import requests
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service as ChromeService
+    from selenium.webdriver.chrome.options import Options
+    from selenium.common.exceptions import NoSuchWindowException, WebDriverException
+
+    settings = get_settings()
     print_if_not_ignored(f"\nStarting download of video {video_index + 1}/{total_videos}: {url}", settings)
     
     # ensure a separate session counter exists for this top-level URL
     with session_lock:
         session_filename_counters.setdefault(url, {})
 
-    # Determine known hosts including custom
-    default_hosts = ["youtube.com", "pornhub.com"]
-    custom_hosts_str = settings.get('custom_hosts', "")
-    additional_hosts = [host.strip() for host in custom_hosts_str.split(",") if host.strip()] if custom_hosts_str else []
-    known_hosts = default_hosts + additional_hosts
 
     # Handle Newgrounds login if needed
     is_ng = "newgrounds.com/portal/view" in url
@@ -635,7 +1501,7 @@ def download_video_from_page(url, browser_path, save_folder, video_index, total_
                 import browser_cookie3
                 ng_cookies = browser_cookie3.load(domain_name='newgrounds.com')
             except Exception as e:
-                log_error(f"Error loading browser cookies: {e}")
+                log_error("Error loading browser cookies: %s", e)
                 ng_cookies = None
         if ng_cookies is None:
             ng_user = settings.get('ng_username','')
@@ -647,14 +1513,21 @@ def download_video_from_page(url, browser_path, save_folder, video_index, total_
                     session.post("https://www.newgrounds.com/login", data=login_payload)
                     ng_cookies = session.cookies
                 except Exception as e:
-                    log_error(f"Error performing Newgrounds login: {e}")
+                    log_error("Error performing Newgrounds login: %s", e)
                     ng_cookies = None
 
     # If force or known host, use yt_dlp directly
-    if force or any(host in url for host in known_hosts):
+    if force or _is_known_host(url, settings.get('custom_hosts', "")):
         return download_with_youtube_dl(url, save_folder, custom_name, quality)
 
+    # sanitize provided custom name (strip .mp4 if present)
+    if custom_name:
+        base = sanitize_filename(custom_name[:-4] if custom_name.lower().endswith(".mp4") else custom_name)
+
+    stop_event = _get_stop_event()
     for attempt in range(3):
+        if stop_event.is_set():
+            return None
         if attempt < 2:
             print_if_not_ignored(f"\nSelenium attempt {attempt+1} of 2...", settings)
         else:
@@ -666,9 +1539,9 @@ def download_video_from_page(url, browser_path, save_folder, video_index, total_
                 options = Options()
                 options.binary_location = browser_path
                 options.add_argument("--incognito")
-                capabilities = DesiredCapabilities.CHROME.copy()
-                capabilities['goog:loggingPrefs'] = {'performance': 'ALL'}
                 options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+                # Only Network events are needed to find media responses; Page events just add log volume
+                options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
                 if minimize_browser:
                     options.add_argument("--window-position=0,3000")
                     options.add_argument("--headless=new")
@@ -683,95 +1556,96 @@ def download_video_from_page(url, browser_path, save_folder, video_index, total_
                         except:
                             pass
                 driver.get(url)
-                time.sleep(5)
+                # let the page start its media requests; returns early on Ctrl+C
+                if stop_event.wait(5):
+                    return None
 
                 if not custom_name:
-                    # sanitize title extracted from page
-                    raw_name = extract_video_name(driver)
-                    video_name = sanitize_filename(raw_name)
-                    current_save_path = os.path.join(save_folder, f"{video_name}.mp4")
-                else:
-                    # sanitize provided custom name as well (strip .mp4 if present)
-                    base_raw = custom_name[:-4] if custom_name.lower().endswith(".mp4") else custom_name
-                    base = sanitize_filename(base_raw)
-                    current_save_path = os.path.join(save_folder, f"{base}.mp4")
-
+                    # sanitize title extracted from page (once per attempt)
+                    video_name = sanitize_filename(extract_video_name(driver))
 
                 logs = driver.get_log('performance')
                 video_links = []
+                seen_links = set()
                 for log in logs:
-                    log_message = json.loads(log['message'])
-                    message = log_message.get('message', {})
+                    raw_message = log['message']
+                    # most performance log entries are other events; skip them before decoding
+                    if 'Network.responseReceived' not in raw_message:
+                        continue
+                    message = _json_loads(raw_message).get('message', {})
                     if message.get('method') == 'Network.responseReceived':
                         response = message.get('params', {}).get('response', {})
-                        if 'video' in response.get('mimeType', '') or '.mp4' in response.get('url', '') or '.m3u8' in response.get('url', '') or '.wav' in response.get('url', ''):
-                            video_links.append(response.get('url'))
-
-                    if video_links:
-                        # dedupe identical resource URLs logged multiple times
-                        unique_video_links = []
-                        for v in video_links:
-                            if v and v not in unique_video_links:
-                                unique_video_links.append(v)
-
-                        # determine base name if not provided
-                        if not custom_name:
-                            video_name = sanitize_filename(extract_video_name(driver))
-
-                        downloaded_any = False
-                        final_path = None
-
-                        for idx, video_url_found in enumerate(unique_video_links):
-                            # if custom name provided, create numbered variant directly
-                            if custom_name:
-                                base_raw = custom_name[:-4] if custom_name.lower().endswith(".mp4") else custom_name
-                                base = sanitize_filename(base_raw)
-                                if len(unique_video_links) > 1:
-                                    candidate = os.path.join(save_folder, f"{base}({idx+1}).mp4")
-                                else:
-                                    candidate = os.path.join(save_folder, f"{base}.mp4")
-                                if os.path.exists(candidate) and not overwrite_existing:
-                                    print_if_not_ignored(f"Skipping existing file: {candidate}", settings)
-                                    continue
-                                current_save_path = candidate
-                                # Download via direct stream or yt_dlp fallback - prefer direct download
-                                ok = download_media_url(video_url_found, current_save_path, settings, original_page_url=url)
-                                
-                                if not ok:
-                                    # fallback to yt_dlp single-download
-                                    current_save_path = download_with_youtube_dl(video_url_found, save_folder, custom_name=base, quality=quality, session_key=url, overwrite_existing=overwrite_existing)
-                                if current_save_path:
-                                    downloaded_any = True
-                                    final_path = current_save_path
+                        response_url = response.get('url', '')
+                        if 'video' in response.get('mimeType', '') or any(ext in response_url for ext in _MEDIA_EXTS):
+                            # dedupe identical resource URLs logged multiple times
+                            if response_url and response_url not in seen_links:
+                                seen_links.add(response_url)
+                                video_links.append(response_url)
+
+                # Download the collected links once the whole log has been scanned
+                if video_links:
+                    downloaded_any = False
+                    final_path = None
+
+                    for idx, video_url_found in enumerate(video_links):
+                        if stop_event.is_set():
+                            break
+                        # if custom name provided, create numbered variant directly
+                        if custom_name:
+                            if len(video_links) > 1:
+                                candidate = os.path.join(save_folder, f"{base}({idx+1}).mp4")
                             else:
-                                # no custom name => resolve filename using session_key=url so multiple items on same page get numbered
-                                resolved = resolve_available_filename(save_folder, video_name, ext=".mp4", overwrite_existing=overwrite_existing, session_key=url)
-                                if resolved is None:
-                                    print_if_not_ignored(f"Skipping existing file: {os.path.join(save_folder, video_name + '.mp4')}", settings)
-                                    continue
-                                # prefer direct download
+                                candidate = os.path.join(save_folder, f"{base}.mp4")
+                            if os.path.exists(candidate) and not overwrite_existing:
+                                print_if_not_ignored(f"Skipping existing file: {candidate}", settings)
+                                continue
+                            current_save_path = candidate
+                            # Download via direct stream or yt_dlp fallback - prefer direct download
+                            ok = download_media_url(video_url_found, current_save_path, settings, original_page_url=url)
+                            if not ok and stop_event.is_set():
+                                # aborted, not failed: no yt_dlp fallback
+                                break
+                            if not ok:
+                                # fallback to yt_dlp single-download
+                                current_save_path = download_with_youtube_dl(video_url_found, save_folder, custom_name=base, quality=quality, session_key=url, overwrite_existing=overwrite_existing)
+                            if current_save_path:
+                                downloaded_any = True
+                                final_path = current_save_path
+                        else:
+                            # no custom name => resolve filename using session_key=url so multiple items on same page get numbered
+                            resolved = resolve_available_filename(save_folder, video_name, ext=".mp4", overwrite_existing=overwrite_existing, session_key=url, claim=True)
+                            if resolved is None:
+                                print_if_not_ignored(f"Skipping existing file: {os.path.join(save_folder, video_name + '.mp4')}", settings)
+                                continue
+                            # prefer direct download
+                            try:
                                 ok = download_media_url(video_url_found, resolved, settings, original_page_url=url)
-                                if not ok:
-                                    # fallback: yt_dlp (will use session_key=url internally)
-                                    final_from_ydl = download_with_youtube_dl(url, save_folder, custom_name=None, quality=quality, session_key=url, overwrite_existing=overwrite_existing)
-                                    if final_from_ydl:
-                                        downloaded_any = True
-                                        final_path = final_from_ydl
-                                else:
+                            finally:
+                                # the yt_dlp fallback resolves (and claims) its own name
+                                _release_filenames(resolved)
+                            if not ok and stop_event.is_set():
+                                break
+                            if not ok:
+                                # fallback: yt_dlp (will use session_key=url internally)
+                                final_from_ydl = download_with_youtube_dl(url, save_folder, custom_name=None, quality=quality, session_key=url, overwrite_existing=overwrite_existing)
+                                if final_from_ydl:
                                     downloaded_any = True
-                                    final_path = resolved
+                                    final_path = final_from_ydl
+                            else:
+                                downloaded_any = True
+                                final_path = resolved
 
-                        if downloaded_any:
-                            return final_path
-                        else:
-                            print_if_not_ignored("No downloadable video links or all skipped due to existing files.", settings)
+                    if downloaded_any:
+                        return final_path
+                    else:
+                        print_if_not_ignored("No downloadable video links or all skipped due to existing files.", settings)
                 else:
                     print_if_not_ignored("No video links found. Retrying...", settings)
             except (NoSuchWindowException, WebDriverException) as e:
-                log_error(f"WebDriver error: {e}. Retrying...")
+                log_error("WebDriver error: %s. Retrying...", e)
                 print_if_not_ignored(f"WebDriver error: {e}. Retrying...", settings)
             except Exception as e:
-                log_error(f"Error: {e}. Retrying...")
+                log_error("Error: %s. Retrying...", e)
                 print_if_not_ignored(f"Error: {e}. Retrying...", settings)
             finally:
                 if driver:
@@ -784,47 +1658,136 @@ def download_video_from_page(url, browser_path, save_folder, video_index, total_
 
     return None
 
+def _iter_urls(lines):
+    """Yields (line_index, url) for every non-empty line."""
+    for index, line in enumerate(lines):
+        line = line.strip()
+        if line:
+            yield index, line
+
+def _download_list_entry(url, browser_path, save_folder, video_index, total_videos,
+                         minimize_browser, overwrite_existing, force, quality, settings):
+    """Downloads a single entry of a URL list and reports the elapsed time."""
+    if _get_stop_event().is_set():
+        return None
+
+    print_if_not_ignored(f"\n[{video_index + 1}/{total_videos}] Starting download for: {url}", settings)
+    start_time = time.time()
+    final_path = download_video_from_page(url, browser_path, save_folder, video_index,
+                                          total_videos, minimize_browser, overwrite_existing,
+                                          force=force, quality=quality)
+    elapsed_time = time.time() - start_time
+    if final_path:
+        print(f"Download completed in {elapsed_time:.2f} seconds: {final_path}")
+    else:
+        print(f"Download failed in {elapsed_time:.2f} seconds.")
+    return final_path
+
+def _download_urls_concurrently(urls, browser_path, save_folder, minimize_browser, overwrite_existing,
+                                force, quality, settings):
+    """
+    Downloads the given page URLs with up to 'max_concurrency' (setting, default 4) at the same time.
+    Output file names are claimed through resolve_available_filename, so entries with the same
+    title never write to the same file.
+    Once the stop event is set, entries that have not started are cancelled; running ones stop
+    at their next check (between Selenium attempts and links, in the HTTP copy loop and in
+    yt_dlp's progress hook).
+    """
+    from concurrent.futures import wait, FIRST_COMPLETED
+
+    try:
+        max_workers = max(1, int(settings.get('max_concurrency', 4)))
+    except ValueError:
+        max_workers = 4
+
+    stop_event = _get_stop_event()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        pending = {
+            executor.submit(_download_list_entry, url, browser_path, save_folder, video_index,
+                            len(urls), minimize_browser, overwrite_existing, force, quality, settings)
+            for video_index, url in enumerate(urls)
+        }
+        cancelled = False
+        while pending:
+            # wake up periodically so Ctrl+C cancels queued entries without waiting for a running one
+            done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            if stop_event.is_set() and not cancelled:
+                cancelled = True
+                for future in pending:
+                    future.cancel()
+            for future in done:
+                if future.cancelled():
+                    continue
+                try:
+                    future.result()
+                except Exception as e:
+                    log_error("Error processing list entry: %s", e)
+                    print_if_not_ignored(f"Error processing list entry: {e}", settings)
+
+    if _get_stop_event().is_set():
+        print_if_not_ignored("\nAbort signal received. Terminating further downloads.", settings)
+
 def download_videos_from_list(file_path, browser_path, save_folder, minimize_browser, overwrite_existing, force=False, quality=None):
-    """Downloads multiple videos listed in a file."""
-    settings = load_settings(SETTINGS_PATH)
+    """
+    Downloads multiple videos listed in a file.
+    Up to 'max_concurrency' (setting, default 4) URLs are processed at the same time.
+    """
+    settings = get_settings()
     try:
-        with open(file_path, 'r') as file:
-            urls = file.readlines()
+        # One directory listing instead of a stat per URL; check_file_exists only runs
+        # for names that are present (it reports skipping/overwriting)
+        try:
+            with os.scandir(save_folder) as it:
+                existing = {entry.name for entry in it}
+        except OSError:
+            existing = set()
 
-        total_videos = len(urls)
         video_save_paths = []
-        for index, url in enumerate(urls):
-            url = url.strip()
-            if url:
+        with open(file_path, 'r', encoding='utf-8', buffering=1 << 20) as file:
+            for index, url in _iter_urls(file):
                 tentative_video_name = f"video_{index + 1}.mp4"
                 save_path = os.path.join(save_folder, tentative_video_name)
-                if not check_file_exists(save_path, overwrite_existing):
+                if tentative_video_name not in existing or not check_file_exists(save_path, overwrite_existing):
                     video_save_paths.append((url, save_path))
 
-        for video_index, (url, save_path) in enumerate(video_save_paths):
-            if stop_download.is_set():
-                print_if_not_ignored("\nAbort signal received. Terminating further downloads.", settings)
-                break
-
-            print_if_not_ignored(f"\n[{video_index + 1}/{len(video_save_paths)}] Starting download for: {url}", settings)
-            start_time = time.time()
-            final_path = download_video_from_page(url, browser_path, save_folder, video_index,
-                                                  len(video_save_paths), minimize_browser, overwrite_existing,
-                                                  force=force, quality=quality)
-            elapsed_time = time.time() - start_time
-            if final_path:
-                print(f"Download completed in {elapsed_time:.2f} seconds: {final_path}")
-            else:
-                print(f"Download failed in {elapsed_time:.2f} seconds.")
+        if not video_save_paths:
+            return
+
+        _download_urls_concurrently([url for url, _ in video_save_paths], browser_path, save_folder,
+                                    minimize_browser, overwrite_existing, force, quality, settings)
     except Exception as e:
-        log_error(f"Error processing list: {e}")
+        log_error("Error processing list: %s", e)
         print_if_not_ignored(f"Error processing list: {e}", settings)
 
 # ====== Session-based filename counters to number files from same URL/session ======
 session_filename_counters = {}
 session_lock = threading.Lock()
+# Directory listings used for numbering: folder -> (mtime_ns, set of entry names)
+_dir_snapshots = {}
+# Paths handed out with claim=True whose download has not finished yet, across all threads
+_claimed_paths = set()
 
-def resolve_available_filename(save_folder, base_name, ext=".mp4", overwrite_existing=False, session_key=None):
+def _dir_entry_names(save_folder):
+    """
+    Returns the set of entry names in save_folder (call with session_lock held).
+    The listing is cached until the directory's mtime changes.
+    """
+    try:
+        mtime = os.stat(save_folder).st_mtime_ns
+    except OSError:
+        return set()
+    cached = _dir_snapshots.get(save_folder)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    try:
+        with os.scandir(save_folder) as it:
+            names = {entry.name for entry in it}
+    except OSError:
+        names = set()
+    _dir_snapshots[save_folder] = (mtime, names)
+    return names
+
+def resolve_available_filename(save_folder, base_name, ext=".mp4", overwrite_existing=False, session_key=None, reserved=None, claim=False):
     """
     Determine an available filename in save_folder.
 
@@ -837,6 +1800,11 @@ def resolve_available_filename(save_folder, base_name, ext=".mp4", overwrite_exi
             - If session_key provided:
                 - If this session already has a counter for this base -> find next NAME(n) that doesn't exist and return it.
                 - If this session has no counter for this base -> return None (skip) — prevents numbering across separate runs.
+    - reserved: optional set of paths already handed out for the current batch but not yet
+      written; they are treated like existing files (and never returned twice, even when overwriting).
+    - claim: if True, the returned path is marked as in use until _release_filenames() is called.
+      Claimed paths are treated like reserved ones by every thread, so parallel downloads
+      never get the same file name; the check and the claim happen under one lock.
     """
     # sanitize base name for filesystem safety (sanitize_filename must exist)
     safe_base = sanitize_filename(base_name)
@@ -846,19 +1814,33 @@ def resolve_available_filename(save_folder, base_name, ext=".mp4", overwrite_exi
 
     base_candidate = os.path.join(save_folder, f"{safe_base}{ext}")
 
+    with session_lock:
+        taken = _claimed_paths.union(reserved) if reserved else _claimed_paths
+        path = _pick_filename(save_folder, safe_base, ext, base_candidate, overwrite_existing, session_key, taken)
+        if claim and path is not None:
+            _claimed_paths.add(path)
+        return path
+
+def _pick_filename(save_folder, safe_base, ext, base_candidate, overwrite_existing, session_key, taken):
+    """Body of resolve_available_filename (call with session_lock held)."""
     if overwrite_existing:
         # If overwriting is allowed, always return the base path (will overwrite)
-        return base_candidate
+        if base_candidate not in taken:
+            return base_candidate
+        # ... unless another download already writes to it; never hand out the same path twice
+        idx = 1
+        while os.path.join(save_folder, f"{safe_base}({idx}){ext}") in taken:
+            idx += 1
+        return os.path.join(save_folder, f"{safe_base}({idx}){ext}")
 
     # If base file does not exist -> use it.
-    if not os.path.exists(base_candidate):
+    if base_candidate not in taken and not os.path.exists(base_candidate):
         # If session_key provided, initialize the counter for this base so subsequent files in this session can be numbered.
         if session_key:
-            with session_lock:
-                counters = session_filename_counters.setdefault(session_key, {})
-                # initialize to 1 meaning the next duplicate will be NAME(1)
-                if safe_base not in counters:
-                    counters[safe_base] = 1
+            counters = session_filename_counters.setdefault(session_key, {})
+            # initialize to 1 meaning the next duplicate will be NAME(1)
+            if safe_base not in counters:
+                counters[safe_base] = 1
         return base_candidate
 
     # base file exists and overwrite not allowed
@@ -867,47 +1849,67 @@ def resolve_available_filename(save_folder, base_name, ext=".mp4", overwrite_exi
         return None
 
     # If session_key provided, only allow numbering if this session already used the base (i.e. we created it earlier in this session)
-    with session_lock:
-        counters = session_filename_counters.setdefault(session_key, {})
-        # If this base was not created in this session, skip (respect global setting across process boundaries)
-        if safe_base not in counters:
-            return None
+    counters = session_filename_counters.setdefault(session_key, {})
+    # If this base was not created in this session, skip (respect global setting across process boundaries)
+    if safe_base not in counters:
+        return None
 
-        # Otherwise generate the next numbered filename within this session
-        idx = counters.get(safe_base, 1)
-        while True:
-            candidate = os.path.join(save_folder, f"{safe_base}({idx}){ext}")
+    # Otherwise generate the next numbered filename within this session.
+    # Names are checked against one directory listing; the chosen candidate is
+    # confirmed with a single stat in case the listing is stale.
+    existing = _dir_entry_names(save_folder)
+    idx = counters.get(safe_base, 1)
+    while True:
+        name = f"{safe_base}({idx}){ext}"
+        candidate = os.path.join(save_folder, name)
+        if name not in existing and candidate not in taken:
             if not os.path.exists(candidate):
                 # store next index for future duplicates in this session
                 counters[safe_base] = idx + 1
                 return candidate
-            idx += 1
+            existing.add(name)
+        idx += 1
+
+def _release_filenames(*paths):
+    """Releases paths claimed by resolve_available_filename(claim=True) once their download is over."""
+    with session_lock:
+        _claimed_paths.difference_update(paths)
 
 # ---------------------------
 # yt_dlp progress hook
 # ---------------------------
+_SIZE_UNITS = ('', 'K', 'M', 'G', 'T', 'P')
+
 def human_readable_size(num, suffix='B'):
-    # simple bytes -> human string
+    # simple bytes -> human string (unit picked from the binary exponent)
     try:
         num = float(num)
     except Exception:
         return "0B"
-    for unit in ['','K','M','G','T','P']:
-        if abs(num) < 1024.0:
-            return f"{num:3.1f}{unit}{suffix}"
-        num /= 1024.0
-    return f"{num:.1f}P{suffix}"
+    magnitude = abs(num)
+    i = min(int(math.log2(magnitude)) // 10, 5) if magnitude >= 1024 and math.isfinite(magnitude) else 0
+    return f"{num / (1 << (10 * i)):3.1f}{_SIZE_UNITS[i]}{suffix}"
 
+# Time of the last progress line per file; 'downloading' updates are printed at most 5 times a second
+_progress_last_print = {}
 
 def ytdlp_progress_hook(d):
     """
     yt_dlp progress hook. Wird von yt_dlp aufgerufen, Status in d['status'].
     Mögliche keys: status ('downloading'|'finished'|'error'), downloaded_bytes, total_bytes, eta, speed, filename
+    Bricht den Download mit DownloadCancelled ab, sobald das Stop-Event gesetzt ist.
     """
+    if _get_stop_event().is_set():
+        from yt_dlp.utils import DownloadCancelled
+        raise DownloadCancelled("Download aborted")
     try:
         status = d.get('status')
         filename = d.get('filename') or d.get('info_dict', {}).get('title') or ''
         if status == 'downloading':
+            now = time.monotonic()
+            if now - _progress_last_print.get(filename, 0.0) < 0.2:
+                return
+            _progress_last_print[filename] = now
             downloaded = d.get('downloaded_bytes') or 0
             total = d.get('total_bytes') or d.get('total_bytes_estimate') or 0
             speed = d.get('speed') or 0
@@ -921,18 +1923,28 @@ def ytdlp_progress_hook(d):
             speed_str = f"{human_readable_size(speed)}/s" if speed else "-"
             eta_str = f"{int(eta)}s" if eta else "-"
             # Print a single-line progress (carriage return)
-            print(f"\rDownloading: {os.path.basename(filename)} | {pct_str} | {human_readable_size(downloaded)}/{human_readable_size(total) if total else '??'} | {speed_str} | ETA {eta_str}", end='', flush=True)
+            sys.stdout.write(f"\rDownloading: {os.path.basename(filename)} | {pct_str} | {human_readable_size(downloaded)}/{human_readable_size(total) if total else '??'} | {speed_str} | ETA {eta_str}")
+            sys.stdout.flush()
         elif status == 'finished':
+            _progress_last_print.pop(filename, None)
             # finish line with newline
             print()  # finish previous line
             print(f"Finished: {os.path.basename(d.get('filename') or '')} (saved)")
         elif status == 'error':
+            _progress_last_print.pop(filename, None)
             print() 
             print(f"Error downloading: {d.get('filename') or ''}")
     except Exception:
         # Fail silently (do not break yt_dlp)
         pass
 
+def _format_score(f, _get=dict.get):
+    return ((_get(f, 'height') or 0), (_get(f, 'tbr') or 0))
+
+def _best_format(formats):
+    """Returns the format dict with the highest height, then bitrate, or None."""
+    return max(formats, key=_format_score, default=None) if formats else None
+
 def get_direct_media_url(entry_obj, entry_url_fallback, quality='best', ydl_instance=None):
     """
     Versucht, aus einem entry-Objekt (wie aus info['entries']) eine konkrete media-URL und Meta zurückzugeben.
@@ -942,49 +1954,42 @@ def get_direct_media_url(entry_obj, entry_url_fallback, quality='best', ydl_inst
     meta_dict keys: ext, filesize, duration, format_id
     """
     meta = {}
+    get = entry_obj.get
+    url = get('url')
+    formats = get('formats')
+    requested_formats = get('requested_formats')
+
     # 1) entry direct url
-    if entry_obj.get('url') and isinstance(entry_obj.get('url'), str):
-        media_url = entry_obj.get('url')
-        meta['ext'] = entry_obj.get('ext') or ''
-        meta['filesize'] = entry_obj.get('filesize') or entry_obj.get('filesize_approx')
-        meta['duration'] = entry_obj.get('duration')
-        return media_url, meta
+    if url and isinstance(url, str):
+        meta['ext'] = get('ext') or ''
+        meta['filesize'] = get('filesize') or get('filesize_approx')
+        meta['duration'] = get('duration')
+        return url, meta
 
     # 2) formats list
-    if entry_obj.get('formats'):
-        formats = entry_obj.get('formats', [])
-        # choose best by height then bitrate
-        def score(f):
-            return ((f.get('height') or 0), (f.get('tbr') or 0))
-        formats_sorted = sorted(formats, key=score, reverse=True)
-        chosen = formats_sorted[0] if formats_sorted else None
+    if formats:
+        chosen = _best_format(formats)
         if chosen:
-            media_url = chosen.get('url')
-            meta['ext'] = chosen.get('ext') or chosen.get('format_id') or ''
-            meta['filesize'] = chosen.get('filesize') or chosen.get('filesize_approx')
-            meta['duration'] = chosen.get('duration') or entry_obj.get('duration')
-            meta['format_id'] = chosen.get('format_id')
-            return media_url, meta
+            chosen_get = chosen.get
+            meta['ext'] = chosen_get('ext') or chosen_get('format_id') or ''
+            meta['filesize'] = chosen_get('filesize') or chosen_get('filesize_approx')
+            meta['duration'] = chosen_get('duration') or get('duration')
+            meta['format_id'] = chosen_get('format_id')
+            return chosen_get('url'), meta
 
     # 3) requested_formats
-    if entry_obj.get('requested_formats'):
-        rf = entry_obj.get('requested_formats')[0]
-        media_url = rf.get('url')
-        meta['ext'] = rf.get('ext') or ''
-        meta['filesize'] = rf.get('filesize') or rf.get('filesize_approx')
-        meta['duration'] = rf.get('duration')
-        return media_url, meta
-
-    # 4) fallback: try to re-extract via provided ydl_instance or temporary one
+    if requested_formats:
+        rf_get = requested_formats[0].get
+        meta['ext'] = rf_get('ext') or ''
+        meta['filesize'] = rf_get('filesize') or rf_get('filesize_approx')
+        meta['duration'] = rf_get('duration')
+        return rf_get('url'), meta
+
+    # 4) fallback: re-extract (cached) via provided ydl_instance or the pooled one
     try:
-        close_temp = False
-        if ydl_instance is None:
-            import yt_dlp
-            ydl_instance = yt_dlp.YoutubeDL({'quiet': True, 'format': quality})
-            close_temp = True
         entry_info = None
         try:
-            entry_info = ydl_instance.extract_info(entry_url_fallback, download=False)
+            entry_info = _cached_extract(entry_url_fallback, quality, ydl=ydl_instance)
         except Exception:
             entry_info = None
         if entry_info:
@@ -993,109 +1998,242 @@ def get_direct_media_url(entry_obj, entry_url_fallback, quality='best', ydl_inst
                 meta['ext'] = entry_info.get('ext') or ''
                 meta['filesize'] = entry_info.get('filesize') or entry_info.get('filesize_approx')
                 meta['duration'] = entry_info.get('duration')
-                if close_temp:
-                    try:
-                        ydl_instance.close()
-                    except Exception:
-                        pass
                 return media_url, meta
             if entry_info.get('formats'):
-                formats = entry_info.get('formats', [])
-                def score2(f): return ((f.get('height') or 0), (f.get('tbr') or 0))
-                chosen = sorted(formats, key=score2, reverse=True)[0] if formats else None
+                chosen = _best_format(entry_info.get('formats'))
                 if chosen:
                     media_url = chosen.get('url')
                     meta['ext'] = chosen.get('ext') or chosen.get('format_id') or ''
                     meta['filesize'] = chosen.get('filesize') or chosen.get('filesize_approx')
                     meta['duration'] = chosen.get('duration') or entry_info.get('duration')
-                    if close_temp:
-                        try:
-                            ydl_instance.close()
-                        except Exception:
-                            pass
                     return media_url, meta
     except Exception:
         pass
 
     return None, {}
 
+_MEDIA_CONFIG = None
+
+def _media_config(settings):
+    """
+    Returns the settings download_media_url needs, parsed once into a SimpleNamespace.
+    The result is reused while the same settings dict is passed in (get_settings hands out
+    one dict until Settings.txt changes); an already resolved config is returned as is.
+    """
+    global _MEDIA_CONFIG
+    if isinstance(settings, SimpleNamespace):
+        return settings
+    cached = _MEDIA_CONFIG
+    if cached is not None and cached[0] is settings:
+        return cached[1]
+    range_parts = _range_parts(settings.get('range_parts', 4))
+    cfg = SimpleNamespace(
+        settings=settings,
+        ua=settings.get('user_agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'),
+        referer=settings.get('last_page_referer') or '',
+        threaded_writes=settings.get('threaded_writes', 'false').lower() == 'true',
+        range_parts=range_parts,
+        use_browser_cookies=settings.get('use_browser_cookies', 'false').lower() == 'true',
+    )
+    _MEDIA_CONFIG = (settings, cfg)
+    return cfg
+
 def download_media_url(media_url, target_path, settings, original_page_url=None, max_retries=3):
     """
     Robust download + unified progress reporting:
      - Uses requests streaming and reports progress via ytdlp_progress_hook for a unified look.
-     - Falls Content-Length vorhanden ist -> berechnet Prozent / ETA / Speed.
-     - Bei fehlendem Content-Length -> zeigt laufenden 'downloading' status mit downloaded_bytes.
-     - ffmpeg fallback bleibt erhalten; meldet ebenfalls 'downloading'/'finished'.
-    Returns True on success, False on failure.
+     - With a Content-Length -> reports percentage / ETA / speed.
+     - Without a Content-Length -> reports a running 'downloading' status with downloaded_bytes.
+     - On 403/401 retries once with browser cookies (use_browser_cookies) and an Origin header.
+     - Keeps the ffmpeg fallback (used directly for HLS/DASH); it also reports 'downloading'/'finished'.
+     - Large files (>= 8 MiB) are split into 'range_parts' parallel Range requests if the server allows it.
+     - At most 'max_connections_per_host' connections to the same host are open at once
+       (extra ranged parts count against this limit).
+    settings may be the settings dict or a config resolved by _media_config.
+    Returns True on success, False on failure or abort; callers check the stop event
+    before starting a fallback download.
     """
     if not media_url:
         return False
 
-    ua = settings.get('user_agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)')
-    referer = original_page_url or settings.get('last_page_referer') or ''
+    cfg = _media_config(settings)
+    slot = _host_slot(media_url, cfg.settings)
+    with slot:
+        return _download_media_url(media_url, target_path, cfg, original_page_url, max_retries, slot)
+
+def _media_progress_reporter(target_path, total_size):
+    """
+    Returns on_progress(n) that adds n downloaded bytes and reports the running totals
+    (speed, ETA) through ytdlp_progress_hook for a unified look.
+    """
+    progress = {'downloaded': 0, 'start': time.time()}
+
+    def report(n):
+        progress['downloaded'] += n
+        downloaded = progress['downloaded']
+        elapsed = time.time() - progress['start']
+        speed = int(downloaded / elapsed) if elapsed > 0 else 0
+        eta = int((total_size - downloaded) / speed) if (total_size and speed) else None
+        try:
+            ytdlp_progress_hook({
+                'status': 'downloading',
+                'filename': os.path.basename(target_path),
+                'downloaded_bytes': downloaded,
+                'total_bytes': total_size,
+                'speed': speed,
+                'eta': eta,
+            })
+        except Exception:
+            # Keep downloading even if progress hook fails
+            pass
+
+    return report
+
+_STREAM_MANIFEST_EXTS = ('.m3u8', '.mpd')
+
+def _replace_part(tmp, target_path):
+    """
+    Moves a finished .part file onto target_path. When the two are on different filesystems
+    (EXDEV, e.g. a bind-mounted target in a container) the data is copied kernel-side
+    (shutil.copyfile uses sendfile on Linux) and the .part file removed.
+    """
+    try:
+        os.replace(tmp, target_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copyfile(tmp, target_path)
+        os.unlink(tmp)
+
+def _load_browser_cookies(url):
+    """Returns the browser's cookies for url's domain, or None if browser_cookie3 cannot load them."""
+    try:
+        import browser_cookie3
+        domain = urlparse(url).hostname or ''
+        if domain.startswith('www.'):
+            domain = domain[4:]
+        return browser_cookie3.load(domain_name=domain)
+    except Exception as e:
+        log_error("Error loading browser cookies: %s", e)
+        return None
+
+def _download_media_url(media_url, target_path, cfg, original_page_url, max_retries, slot):
+    """Body of download_media_url, called while holding one of the host's slots."""
+    import requests
+    import urllib3
+
+    ua = cfg.ua
+    referer = original_page_url or cfg.referer
     headers = {'User-Agent': ua}
     if referer:
         headers['Referer'] = referer
 
-    session = requests.Session()
-    session.headers.update(headers)
+    session = _get_http_session()
+    threaded_writes = cfg.threaded_writes
+
+    # HLS/DASH manifests need ffmpeg to fetch and join the segments
+    if urlparse(media_url).path.lower().endswith(_STREAM_MANIFEST_EXTS):
+        return _download_with_ffmpeg(media_url, target_path, ua, referer)
 
+    # Large files on servers that accept byte ranges are fetched over several connections;
+    # each extra part takes a free slot of the host's connection budget
+    extra = _borrow_host_slots(slot, cfg.range_parts - 1)
+    try:
+        # fetch_url is media_url after redirects, reused so parts and retries skip the redirect hop
+        total_size, fetch_url = _probe_ranged_size(media_url, headers) if extra else (0, media_url)
+        if total_size >= _RANGED_MIN_SIZE:
+            tmp = target_path + ".part"
+            parent = os.path.dirname(target_path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            report = _media_progress_reporter(target_path, total_size)
+            if _download_ranges(fetch_url, tmp, total_size, 1 + extra, headers=headers, on_progress=report):
+                _replace_part(tmp, target_path)
+                try:
+                    ytdlp_progress_hook({'status': 'finished', 'filename': os.path.basename(target_path)})
+                except Exception:
+                    pass
+                return True
+            if _get_stop_event().is_set():
+                return False
+    finally:
+        for _ in range(extra):
+            slot.release()
+
+    stop_event = _get_stop_event()
+    cookies = None
+    auth_retried = False
     attempt = 0
     while attempt < max_retries:
+        if stop_event.is_set():
+            return False
         attempt += 1
         try:
-            with session.get(media_url, stream=True, timeout=(10, 60), allow_redirects=True) as r:
+            with session.get(fetch_url, headers=headers, cookies=cookies, stream=True,
+                             timeout=(10, 60), allow_redirects=True) as r:
                 status = r.status_code
+                if r.url:
+                    fetch_url = r.url
                 if status == 200:
                     total_size = int(r.headers.get('content-length', 0) or 0)
                     tmp = target_path + ".part"
-                    block_size = 1024 * 1024
-
-                    downloaded = 0
-                    start_time = time.time()
+                    block_size = 4 * 1024 * 1024
 
                     # Ensure parent dir exists
                     parent = os.path.dirname(target_path)
                     if parent:
                         os.makedirs(parent, exist_ok=True)
 
-                    with open(tmp, "wb") as fh:
-                        for chunk in r.iter_content(chunk_size=block_size):
-                            if not chunk:
-                                continue
-                            fh.write(chunk)
-                            downloaded += len(chunk)
-
-                            # Compute speed and ETA
-                            elapsed = time.time() - start_time
-                            speed = int(downloaded / elapsed) if elapsed > 0 else 0
-                            eta = int((total_size - downloaded) / speed) if (total_size and speed) else None
-
-                            # Build progress dict compatible with ytdlp_progress_hook
-                            progress_dict = {
-                                'status': 'downloading',
-                                'filename': os.path.basename(target_path),
-                                'downloaded_bytes': downloaded,
-                                'total_bytes': total_size,
-                                'speed': speed,
-                                'eta': eta
-                            }
-                            try:
-                                ytdlp_progress_hook(progress_dict)
-                            except Exception:
-                                # Keep downloading even if progress hook fails
-                                pass
+                    # Copy the raw stream in large blocks; progress is sampled every ~4 MiB
+                    r.raw.decode_content = True
+                    reader = _ProgressReader(r.raw, _media_progress_reporter(target_path, total_size),
+                                             flush_bytes=4 << 20)
+                    try:
+                        # Unbuffered: the blocks are already large, a BufferedWriter would only add a copy
+                        with open(tmp, "wb", buffering=0) as fh:
+                            # Reserve the space up front so the file is not fragmented while it grows
+                            if total_size and hasattr(os, 'posix_fallocate'):
+                                try:
+                                    os.posix_fallocate(fh.fileno(), 0, total_size)
+                                except OSError:
+                                    pass
+                            if threaded_writes:
+                                writer = _BackgroundWriter(fh)
+                                try:
+                                    shutil.copyfileobj(reader, writer, block_size)
+                                finally:
+                                    writer.close()
+                            else:
+                                _copy_into(reader, fh, block_size)
+                            fh.truncate()
+                    except (urllib3.exceptions.HTTPError, OSError) as e:
+                        # r.raw is read directly, so dropped connections and read timeouts surface
+                        # as urllib3 errors (IncompleteRead, ReadTimeoutError) rather than requests ones
+                        try:
+                            os.remove(tmp)
+                        except OSError:
+                            pass
+                        log_info("Transfer of %s interrupted: %s - retrying (attempt %s)", media_url, e, attempt)
+                        time.sleep(1 + attempt)
+                        continue
+                    reader.flush()
+                    if _get_stop_event().is_set():
+                        try:
+                            os.remove(tmp)
+                        except OSError:
+                            pass
+                        return False
 
                     # Atomic replace
                     try:
-                        os.replace(tmp, target_path)
+                        _replace_part(tmp, target_path)
                     except OSError as e:
-                        log_error(f"Atomic replace failed: {e}. Retrying in 2s...")
+                        log_error("Atomic replace failed: %s. Retrying in 2s...", e)
                         time.sleep(2)
                         try:
-                            os.replace(tmp, target_path)
+                            _replace_part(tmp, target_path)
                         except Exception as e2:
-                            log_error(f"Second attempt to replace temp file failed: {e2}")
+                            log_error("Second attempt to replace temp file failed: %s", e2)
                             try:
                                 if os.path.exists(tmp):
                                     os.remove(tmp)
@@ -1111,23 +2249,41 @@ def download_media_url(media_url, target_path, settings, original_page_url=None,
                             pass
                         return True
                     else:
-                        log_error(f"Downloaded file zero-sized or missing after requests: {target_path}")
+                        log_error("Downloaded file zero-sized or missing after requests: %s", target_path)
                         time.sleep(1 + attempt)
                         continue
 
                 elif status in (403, 401):
-                    log_info(f"HTTP {status} received for {media_url} - will try ffmpeg fallback (attempt {attempt}).")
-                    break  # try ffmpeg next
+                    if auth_retried:
+                        log_info("HTTP %s received for %s - will try ffmpeg fallback (attempt %s).", status, media_url, attempt)
+                        break  # try ffmpeg next
+                    # Usually the server just wants the page's cookies and Origin; retry once with them
+                    auth_retried = True
+                    # the redirect target may be what refused us; start over from the original URL
+                    fetch_url = media_url
+                    log_info("HTTP %s received for %s - retrying with cookies and Origin header.", status, media_url)
+                    if cfg.use_browser_cookies:
+                        cookies = _load_browser_cookies(media_url)
+                    origin_src = urlparse(referer or media_url)
+                    if origin_src.scheme and origin_src.netloc:
+                        headers = {**headers, 'Origin': f"{origin_src.scheme}://{origin_src.netloc}"}
+                    attempt -= 1
+                    continue
                 else:
-                    log_info(f"HTTP {status} for {media_url} - retrying (attempt {attempt})")
+                    log_info("HTTP %s for %s - retrying (attempt %s)", status, media_url, attempt)
                     time.sleep(1 + attempt)
                     continue
         except requests.exceptions.RequestException as e:
-            log_info(f"Requests error when downloading {media_url}: {e} - retrying (attempt {attempt})")
+            log_info("Requests error when downloading %s: %s - retrying (attempt %s)", media_url, e, attempt)
             time.sleep(1 + attempt)
             continue
 
-    # ffmpeg fallback (unified notifications)
+    if stop_event.is_set():
+        return False
+    return _download_with_ffmpeg(media_url, target_path, ua, referer)
+
+def _download_with_ffmpeg(media_url, target_path, ua, referer):
+    """ffmpeg fallback (unified notifications). Returns True on success, False on failure."""
     try:
         # signal start of ffmpeg fallback using the same hook style (no exact progress possible)
         try:
@@ -1143,6 +2299,9 @@ def download_media_url(media_url, target_path, settings, original_page_url=None,
         ff_cmd = [
             "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
             "-headers", ff_headers,
+            # Let ffmpeg reconnect by itself after network blips instead of failing the whole fallback
+            "-reconnect", "1", "-reconnect_streamed", "1", "-reconnect_delay_max", "5",
+            "-rw_timeout", "30000000",
             "-i", media_url,
             "-c", "copy",
             target_path
@@ -1157,9 +2316,9 @@ def download_media_url(media_url, target_path, settings, original_page_url=None,
             return True
         else:
             stderr = proc.stderr.decode(errors='ignore') if proc.stderr else ''
-            log_error(f"ffmpeg failed (rc={proc.returncode}) for {media_url}. stderr: {stderr[:1000]}")
+            log_error("ffmpeg failed (rc=%s) for %s. stderr: %s", proc.returncode, media_url, stderr[:1000])
     except Exception as e:
-        log_error(f"ffmpeg invocation error for {media_url}: {e}")
+        log_error("ffmpeg invocation error for %s: %s", media_url, e)
 
     return False
 
@@ -1184,10 +2343,12 @@ def main():
     group.add_argument('--config', action='store_true', help="Open the configuration file")
     group.add_argument('--list-config', action='store_true', help="Display current configuration settings")
     group.add_argument('--example-config', action='store_true', help="Generate an example configuration file")
+    group.add_argument('--clear-meta-cache', action='store_true', help="Remove cached yt_dlp metadata")
     
     args = parser.parse_args()
-    settings = load_settings(SETTINGS_PATH)
+    settings = get_settings()
     hidden_output = is_output_hidden(settings, args)
+    configure_logging(settings, hidden=hidden_output)
     browser_path = settings.get('browser_path')
     minimize_browser = settings.get('minimized', 'false').lower() == 'true'
     overwrite_existing = settings.get('overwrite_existing', 'false').lower() == 'true'
@@ -1199,10 +2360,9 @@ def main():
     else:
         save_folder = get_default_download_dir(settings)
 
-    if not os.path.exists(save_folder):
-        os.makedirs(save_folder)
+    os.makedirs(save_folder, exist_ok=True)
 
-    if args.config or args.list_config or args.example_config:
+    if args.config or args.list_config or args.example_config or args.clear_meta_cache:
         handle_config(args)
         return
 
@@ -1215,13 +2375,13 @@ def main():
     if args.link:
         url_list.append(args.link.strip())
     if args.urls:
-        url_list += [u.strip() for u in args.urls.split(',') if u.strip()]
+        url_list.extend(filter(None, map(str.strip, args.urls.split(','))))
     if args.list:
         try:
-            with open(args.list, 'r') as f:
-                url_list += [line.strip() for line in f if line.strip()]
+            # One read + splitlines instead of per-line file iteration
+            url_list.extend(filter(None, map(str.strip, Path(args.list).read_text(encoding='utf-8').splitlines())))
         except Exception as e:
-            log_error(f"Error reading list file: {e}")
+            log_error("Error reading list file: %s", e)
             print_if_not_ignored(f"Error reading list file: {e}", settings)
             return
 
@@ -1230,28 +2390,28 @@ def main():
         parser.print_help()
         return
 
-    # Download each URL
-    for idx, url in enumerate(url_list):
-        if stop_download.is_set():
-            break
-        if len(url_list) == 1:
-            start_time = time.time()
-            final_path = download_video_from_page(url, browser_path, save_folder, 0, 1, minimize_browser, overwrite_existing, custom_name=args.name, force=args.force, quality=quality)
-            elapsed_time = time.time() - start_time
-            if final_path:
-                print(f"Download completed in {elapsed_time:.2f} seconds: {final_path}")
-            else:
-                print(f"Download failed in {elapsed_time:.2f} seconds.")
+    # Ctrl+C stops further downloads, a second Ctrl+C interrupts right away
+    # (handlers can only be installed from the main thread)
+    if threading.current_thread() is threading.main_thread():
+        import signal
+        signal.signal(signal.SIGINT, _handle_sigint)
+
+    _warm_dns(url_list)
+
+    # A single URL is downloaded directly (it may use a custom name)
+    if len(url_list) == 1:
+        start_time = time.time()
+        final_path = download_video_from_page(url_list[0], browser_path, save_folder, 0, 1, minimize_browser, overwrite_existing, custom_name=args.name, force=args.force, quality=quality)
+        elapsed_time = time.time() - start_time
+        if final_path:
+            print(f"Download completed in {elapsed_time:.2f} seconds: {final_path}")
         else:
-            print_if_not_ignored(f"\n[{idx+1}/{len(url_list)}] Starting download for: {url}", settings)
-            start_time = time.time()
-            final_path = download_video_from_page(url, browser_path, save_folder, idx, len(url_list), minimize_browser, overwrite_existing, force=args.force, quality=quality)
-            elapsed_time = time.time() - start_time
-            if final_path:
-                print(f"Download completed in {elapsed_time:.2f} seconds: {final_path}")
-            else:
-                print(f"Download failed in {elapsed_time:.2f} seconds.")
+            print(f"Download failed in {elapsed_time:.2f} seconds.")
+        return
+
+    # Several URLs are downloaded concurrently (see 'max_concurrency')
+    _download_urls_concurrently(url_list, browser_path, save_folder, minimize_browser,
+                                overwrite_existing, args.force, quality, settings)
 
 if __name__ == "__main__":
-    signal.signal(signal.SIGINT, lambda sig, frame: stop_download.set())
     main()
\ No newline at end of file
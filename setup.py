@@ -18,6 +18,9 @@ setup(
         "tqdm",
         "yt-dlp",
         "beautifulsoup4",
+        "lxml",
+        "diskcache",
+        "orjson",
         "browser-cookie3",
     ],
     classifiers=[
@@ -0,0 +1,32 @@
+import logging
+import os
+import shutil
+import tempfile
+
+import pytest
+
+# cerberus.downloader creates its config folder, log and Settings.txt at import time;
+# point it at a throwaway home so the tests neither touch nor read the developer's own.
+_TEST_HOME = tempfile.mkdtemp(prefix='cerberus-tests-')
+os.environ['HOME'] = _TEST_HOME
+os.environ['USERPROFILE'] = _TEST_HOME
+os.environ['APPDATA'] = _TEST_HOME
+
+from cerberus import downloader  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fresh_module_state():
+    """Drops the shared HTTP session and per-host connection slots between tests."""
+    yield
+    with downloader._HTTP_SESSION_LOCK:
+        session, downloader._HTTP_SESSION = downloader._HTTP_SESSION, None
+    if session is not None:
+        session.close()
+    with downloader._HOST_SLOTS_LOCK:
+        downloader._HOST_SLOTS.clear()
+
+
+def pytest_unconfigure(config):
+    logging.shutdown()
+    shutil.rmtree(_TEST_HOME, ignore_errors=True)
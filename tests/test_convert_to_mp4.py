@@ -0,0 +1,38 @@
+import subprocess
+
+from cerberus import downloader
+
+
+def _fake_ffmpeg(cmd, **kwargs):
+    with open(cmd[-1], 'w') as fh:
+        fh.write('mp4 data')
+    return subprocess.CompletedProcess(cmd, 0, b'', b'')
+
+
+def test_non_mp4_is_converted_next_to_source(tmp_path, monkeypatch):
+    monkeypatch.setattr(downloader.subprocess, 'run', _fake_ffmpeg)
+    source = tmp_path / 'X.webm'
+    source.write_text('webm data')
+    result = downloader._convert_to_mp4(str(source), {})
+    assert result == str(tmp_path / 'X.mp4')
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['X.mp4']
+    assert (tmp_path / 'X.mp4').read_text() == 'mp4 data'
+
+
+def test_existing_mp4_keeps_source(tmp_path, monkeypatch):
+    monkeypatch.setattr(downloader.subprocess, 'run', _fake_ffmpeg)
+    (tmp_path / 'X.mp4').write_text('other video')
+    source = tmp_path / 'X.webm'
+    source.write_text('webm data')
+    assert downloader._convert_to_mp4(str(source), {}) is None
+    assert (tmp_path / 'X.mp4').read_text() == 'other video'
+    assert source.read_text() == 'webm data'
+
+
+def test_mp4_is_converted_in_place(tmp_path, monkeypatch):
+    monkeypatch.setattr(downloader.subprocess, 'run', _fake_ffmpeg)
+    source = tmp_path / 'X.mp4'
+    source.write_text('webm data in mp4 name')
+    assert downloader._convert_to_mp4(str(source), {}) == str(source)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['X.mp4']
+    assert source.read_text() == 'mp4 data'
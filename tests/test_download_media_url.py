@@ -0,0 +1,101 @@
+import io
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from cerberus import downloader
+
+BODY = os.urandom(1024 * 1024)
+
+
+def _serve(truncate_first):
+    """Starts a local server for BODY; the first `truncate_first` GETs close after 400 KB."""
+    gets = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            gets.append(self.path)
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(BODY)))
+            self.end_headers()
+            if len(gets) <= truncate_first:
+                self.wfile.write(BODY[:400 * 1024])
+                self.close_connection = True
+                return
+            self.wfile.write(BODY)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, gets
+
+
+@pytest.fixture
+def no_fallback(monkeypatch):
+    ffmpeg_calls = []
+    monkeypatch.setattr(downloader, '_download_with_ffmpeg', lambda *args: ffmpeg_calls.append(args) or False)
+    monkeypatch.setattr(downloader.time, 'sleep', lambda seconds: None)
+    return ffmpeg_calls
+
+
+def test_truncated_response_is_retried(tmp_path, no_fallback):
+    server, gets = _serve(truncate_first=1)
+    target = tmp_path / 'video.mp4'
+    try:
+        ok = downloader.download_media_url(f'http://127.0.0.1:{server.server_port}/v.mp4',
+                                           str(target), {'range_parts': '1'})
+    finally:
+        server.shutdown()
+    assert ok is True
+    assert len(gets) == 2
+    assert target.read_bytes() == BODY
+    assert not os.path.exists(str(target) + '.part')
+
+
+def test_truncated_responses_fall_back_without_leaving_part_file(tmp_path, no_fallback):
+    server, gets = _serve(truncate_first=3)
+    target = tmp_path / 'video.mp4'
+    try:
+        ok = downloader.download_media_url(f'http://127.0.0.1:{server.server_port}/v.mp4',
+                                           str(target), {'range_parts': '1'})
+    finally:
+        server.shutdown()
+    assert ok is False
+    assert len(gets) == 3
+    assert len(no_fallback) == 1
+    assert not target.exists()
+    assert not os.path.exists(str(target) + '.part')
+
+
+def test_abort_does_not_start_fallback(tmp_path, no_fallback):
+    server, gets = _serve(truncate_first=0)
+    stop_event = downloader._get_stop_event()
+    stop_event.set()
+    try:
+        ok = downloader.download_media_url(f'http://127.0.0.1:{server.server_port}/v.mp4',
+                                           str(tmp_path / 'video.mp4'), {'range_parts': '1'})
+    finally:
+        stop_event.clear()
+        server.shutdown()
+    assert ok is False
+    assert gets == []
+    assert no_fallback == []
+
+
+def test_background_writer_retries_short_writes():
+    class ShortWrites(io.BytesIO):
+        def write(self, data):
+            return super().write(bytes(data)[:3])
+
+    fh = ShortWrites()
+    writer = downloader._BackgroundWriter(fh)
+    writer.write(b'0123456789')
+    writer.write(b'abcdefg')
+    writer.close()
+    assert fh.getvalue() == b'0123456789abcdefg'
@@ -0,0 +1,46 @@
+import threading
+
+from cerberus import downloader
+
+
+def _resolve_in_parallel(folder, count, **kwargs):
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(i):
+        barrier.wait()
+        results[i] = downloader.resolve_available_filename(str(folder), 'video', session_key=f'http://page/{i}',
+                                                           claim=True, **kwargs)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def test_parallel_claims_never_share_a_path(tmp_path):
+    results = _resolve_in_parallel(tmp_path, 8)
+    try:
+        handed_out = [r for r in results if r]
+        assert handed_out == [str(tmp_path / 'video.mp4')]
+    finally:
+        downloader._release_filenames(*filter(None, results))
+
+
+def test_parallel_claims_when_overwriting_are_numbered(tmp_path):
+    results = _resolve_in_parallel(tmp_path, 4, overwrite_existing=True)
+    try:
+        assert len(set(results)) == 4
+    finally:
+        downloader._release_filenames(*results)
+
+
+def test_released_path_can_be_claimed_again(tmp_path):
+    first = downloader.resolve_available_filename(str(tmp_path), 'video', session_key='a', claim=True)
+    assert downloader.resolve_available_filename(str(tmp_path), 'video', session_key='b', claim=True) is None
+    downloader._release_filenames(first)
+    second = downloader.resolve_available_filename(str(tmp_path), 'video', session_key='b', claim=True)
+    downloader._release_filenames(second)
+    assert first == second